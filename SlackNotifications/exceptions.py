@@ -1,10 +1,9 @@
-from typing import List
+from typing import Dict, List
 
 
 class SlackNotificationChannelDuplicateReferenceException(Exception):
     def __init__(self, channel_names: List[str]) -> None:
-        channel_names = sorted(channel_names)
-        channel_names_str = ", ".join(channel_names)
+        channel_names_str = ", ".join(sorted(channel_names))
         super().__init__(
             f"Duplicate referecne for slack notification channel references=[{channel_names_str}]"
         )
@@ -21,3 +20,22 @@ class SlackNotificationSendFailedException(Exception):
             f"Failed to send Slack notification to channel '{channel_name}'. "
             f"Status Code: {status_code}, Response: {response_body}"
         )
+
+
+class SlackNotificationChannelCircuitOpenException(Exception):
+    def __init__(self, channel_name: str, retry_in: float) -> None:
+        self.retry_in = retry_in
+        super().__init__(
+            f"Slack notification channel '{channel_name}' is failing; "
+            f"circuit breaker open, retry in {retry_in:.1f}s."
+        )
+
+
+class SlackNotificationBroadcastFailedException(Exception):
+    def __init__(self, errors: Dict[str, Exception]) -> None:
+        self.errors = errors
+        channel_names_str = ", ".join(sorted(errors))
+        super().__init__(
+            f"Failed to send Slack notification to channels=[{channel_names_str}]: "
+            + "; ".join(str(error) for error in errors.values())
+        )
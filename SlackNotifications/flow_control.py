@@ -0,0 +1,212 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace requests to a single channel.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Each `acquire` takes
+    one token, sleeping until it is available. Callers that arrive while the bucket is
+    empty reserve future tokens, so concurrent callers are spaced `1 / rate` apart.
+    """
+
+    rate: float
+    """Tokens added per second."""
+
+    capacity: float
+    """Maximum number of tokens held, i.e. the permitted burst size."""
+
+    def __init__(self, rate: float, capacity: float = 1) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens held.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting for the token.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def reserve(self) -> float:
+        """Take one token without waiting for it.
+
+        Lets async callers wait with `asyncio.sleep` rather than blocking the event loop.
+
+        Returns:
+            Seconds until the token is available; the caller must wait this long first.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate) - 1
+            self._last = now
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class AIMDLimiter:
+    """Thread-safe concurrency limiter tuned by additive-increase/multiplicative-decrease.
+
+    The number of in-flight requests is capped at `floor(limit)`. Fast successful requests
+    grow the limit by `alpha`; rate-limited, failed or errored requests shrink it by the
+    factor `beta`, backing off quickly when Slack is degraded and recovering gradually.
+    """
+
+    limit: float
+    """Current (fractional) concurrency limit."""
+
+    min_limit: float
+    """Lower bound for the concurrency limit."""
+
+    max_limit: float
+    """Upper bound for the concurrency limit."""
+
+    alpha: float
+    """Additive increase applied after a successful request within the latency target."""
+
+    beta: float
+    """Multiplicative factor applied after a failed request."""
+
+    def __init__(
+        self,
+        limit: float = 1,
+        min_limit: float = 1,
+        max_limit: float = 16,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limit: Initial concurrency limit.
+            min_limit: Lower bound for the concurrency limit.
+            max_limit: Upper bound for the concurrency limit.
+            alpha: Additive increase applied on success.
+            beta: Multiplicative factor applied on failure.
+        """
+        self.limit = limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.alpha = alpha
+        self.beta = beta
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block until a request slot is free under the current limit, then take it."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._in_flight < max(1, int(self.limit)))
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """Give back a request slot."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def increase(self) -> None:
+        """Additively raise the limit after a healthy request."""
+        with self._cond:
+            self.limit = min(self.max_limit, self.limit + self.alpha)
+            self._cond.notify_all()
+
+    def decrease(self) -> None:
+        """Multiplicatively lower the limit after a failed request."""
+        with self._cond:
+            self.limit = max(self.min_limit, self.limit * self.beta)
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker that stops calls to a persistently failing channel.
+
+    The breaker is CLOSED while calls succeed. After `failure_threshold` consecutive
+    failures it OPENs and rejects calls without touching the network. Once `cooldown`
+    seconds have passed it goes HALF_OPEN and lets a single probe call through: success
+    closes the breaker again, failure re-opens it for another cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    failure_threshold: int
+    """Consecutive failures that open the breaker."""
+
+    cooldown: float
+    """Seconds the breaker stays open before allowing a probe call."""
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker.
+            cooldown: Seconds the breaker stays open before allowing a probe call.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: CLOSED, OPEN or HALF_OPEN."""
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a call may proceed; moves OPEN to HALF_OPEN once the cooldown elapsed."""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                self._state = self.HALF_OPEN
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker will allow a probe call."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def record_neutral(self) -> None:
+        """Record a call that neither proves nor disproves channel health."""
+        with self._lock:
+            self._probe_in_flight = False
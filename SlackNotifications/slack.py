@@ -1,29 +1,315 @@
+import asyncio
+import io
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from logging import getLogger
-from typing import Any, Dict, List
+from logging import INFO, getLogger
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Self,
+    Tuple,
+    Type,
+)
+
+from slack_sdk.webhook.webhook_response import WebhookResponse
 
-from slack_sdk.webhook import WebhookClient
+try:
+    import aiohttp
+    from slack_sdk.webhook.async_client import AsyncWebhookClient
+except ImportError:  # pragma: no cover - aiohttp is an optional extra
+    aiohttp = None  # type: ignore[assignment]
+    AsyncWebhookClient = None  # type: ignore[assignment,misc]
 
 from SlackNotifications.exceptions import (
+    SlackNotificationBroadcastFailedException,
+    SlackNotificationChannelCircuitOpenException,
     SlackNotificationChannelDuplicateReferenceException,
     SlackNotificationChannelNotFoundException,
     SlackNotificationSendFailedException,
 )
+from SlackNotifications.flow_control import AIMDLimiter, CircuitBreaker, TokenBucket
+from SlackNotifications.webhook import (
+    TRANSPORT_ERRORS,
+    ConnectionPool,
+    PooledWebhookClient,
+    encode_blocks,
+    pool_for_url,
+)
 
 logger = getLogger(__file__)
 
+ASYNC_CONNECTION_LIMIT = 100
+"""Maximum number of concurrent connections held by the shared aiohttp session."""
+
+ASYNC_KEEPALIVE_TIMEOUT = 30.0
+"""Seconds an idle keep-alive connection is retained by the shared aiohttp session."""
 
-@dataclass
+ASYNC_TRANSPORT_ERRORS: Tuple[Type[Exception], ...] = TRANSPORT_ERRORS + (
+    (aiohttp.ClientError,) if aiohttp is not None else ()
+)
+"""Errors raised when an async webhook request failed in transit."""
+
+
+@dataclass(slots=True, frozen=True)
 class SlackChannelConfig:
     channel_reference: str
     channel_webhook_url: str
+    rate_per_sec: Optional[float] = 1.0
+    burst: int = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SlackNotificationServiceConfig:
     channels: List[SlackChannelConfig]
     send_to_slack: bool = True
     verbose: bool = False
+    max_retries: int = 3
+    retry_backoff: float = 1.0
+    max_concurrency: int = 16
+    latency_target: float = 1.0
+    coalesce_window_ms: int = 0
+    circuit_failure_threshold: int = 5
+    circuit_cooldown: float = 30.0
+    http2: bool = False
+
+
+SLACK_MAX_BLOCKS = 50
+"""Maximum number of blocks Slack accepts in a single message."""
+
+_DIVIDER_BLOCK: Dict[str, Any] = {"type": "divider"}
+"""Divider block prototype; handed out as a copy since callers may mutate blocks."""
+
+
+_NUMBERED_PREFIX_COUNT = 1024
+_NUMBERED_PREFIXES = tuple(f"{i}. " for i in range(1, _NUMBERED_PREFIX_COUNT + 1))
+"""Precomputed "1. ", "2. ", ... prefixes for `list_items_numbered`."""
+
+
+def generic_message_blocks(title: str, message: str) -> List[Dict[str, Any]]:
+    """Create simple title + message Slack block layout.
+
+    Args:
+        title: Bold title text.
+        message: Message body text.
+
+    Returns:
+        List containing single section block with formatted title and message.
+    """
+    return [section_block(f"*{title}*\n{message}")]
+
+
+def divider_block() -> Dict[str, Any]:
+    """Create horizontal divider Slack block."""
+    return _DIVIDER_BLOCK.copy()
+
+
+def section_block(text: str) -> Dict[str, Any]:
+    """Create section block with mrkdwn text.
+
+    Args:
+        text: Text content supporting Slack mrkdwn formatting.
+
+    Returns:
+        Section block dictionary.
+    """
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def url_link(text: str, url: str) -> str:
+    """Format Slack link syntax: <url|text>.
+
+    Args:
+        text: Display text for link.
+        url: Target URL.
+
+    Returns:
+        Slack-formatted link string.
+    """
+    return f"<{url}|{text}>"
+
+
+def list_items(items: List[str]) -> str:
+    """Format bullet list for Slack mrkdwn.
+
+    Args:
+        items: List of strings to bulletize.
+
+    Returns:
+        Newline-separated bullet list string.
+    """
+    if not items:
+        return ""
+    return "• " + "\n• ".join(items)
+
+
+def list_items_numbered(items: List[str]) -> str:
+    """Format numbered list for Slack mrkdwn.
+
+    Args:
+        items: List of strings to number.
+
+    Returns:
+        Newline-separated numbered list string.
+    """
+    return "\n".join(
+        [
+            _NUMBERED_PREFIXES[i] + item if i < _NUMBERED_PREFIX_COUNT else f"{i + 1}. {item}"
+            for i, item in enumerate(items)
+        ]
+    )
+
+
+def bold_text(text: str) -> str:
+    """Wrap text in Slack bold mrkdwn (*text*).
+
+    Args:
+        text: Text to bold.
+
+    Returns:
+        Bold-formatted string.
+    """
+    return f"*{text}*"
+
+
+def italic_text(text: str) -> str:
+    """Wrap text in Slack italic mrkdwn (_text_).
+
+    Args:
+        text: Text to italicize.
+
+    Returns:
+        Italic-formatted string.
+    """
+    return f"_{text}_"
+
+
+def footer_block(footer_message: str) -> Dict[str, Any]:
+    """Create footer context block with mrkdwn text.
+
+    Args:
+        footer_message: Text to display in footer.
+
+    Returns:
+        Context block dictionary with footer message.
+    """
+    return {
+        "type": "context",
+        "elements": [{"type": "mrkdwn", "text": footer_message}],
+    }
+
+
+class MessageBuilder:
+    """Incrementally build mrkdwn text in a single buffer and emit it as one section block.
+
+    Composing large messages by nesting `bold_text`, `list_items`, `url_link` etc. creates
+    an intermediate string per helper that is then concatenated again by the caller. The
+    builder writes every fragment straight into one `io.StringIO`, so the final text is
+    assembled once. Prefer it for messages longer than a few hundred characters.
+
+    Example:
+        block = MessageBuilder().bold("Deploy").line().bullets(["api", "worker"]).build_section()
+    """
+
+    def __init__(self) -> None:
+        self._buf = io.StringIO()
+
+    def text(self, text: str) -> Self:
+        """Append plain text."""
+        self._buf.write(text)
+        return self
+
+    def bold(self, text: str) -> Self:
+        """Append bold text (*text*)."""
+        write = self._buf.write
+        write("*")
+        write(text)
+        write("*")
+        return self
+
+    def italic(self, text: str) -> Self:
+        """Append italic text (_text_)."""
+        write = self._buf.write
+        write("_")
+        write(text)
+        write("_")
+        return self
+
+    def link(self, text: str, url: str) -> Self:
+        """Append a Slack link (<url|text>)."""
+        write = self._buf.write
+        write("<")
+        write(url)
+        write("|")
+        write(text)
+        write(">")
+        return self
+
+    def line(self, text: str = "") -> Self:
+        """Append text followed by a newline."""
+        self._buf.write(text)
+        self._buf.write("\n")
+        return self
+
+    def bullets(self, items: List[str]) -> Self:
+        """Append a bullet list, one item per line."""
+        write = self._buf.write
+        for item in items:
+            write("• ")
+            write(item)
+            write("\n")
+        return self
+
+    def numbered(self, items: List[str]) -> Self:
+        """Append a numbered list, one item per line."""
+        write = self._buf.write
+        for i, item in enumerate(items):
+            write(_NUMBERED_PREFIXES[i] if i < _NUMBERED_PREFIX_COUNT else f"{i + 1}. ")
+            write(item)
+            write("\n")
+        return self
+
+    def getvalue(self) -> str:
+        """Return the text built so far."""
+        return self._buf.getvalue()
+
+    def build_section(self) -> Dict[str, Any]:
+        """Return the built text as a section block, without a trailing newline."""
+        return section_block(self._buf.getvalue().rstrip("\n"))
+
+
+def _raise_first(errors: List[Exception]) -> None:
+    """Raise the first of `errors`, logging the rest, or return if there are none."""
+    for error in errors[1:]:
+        logger.error("Additional Slack send failure: %s", error)
+    if errors:
+        raise errors[0]
+
+
+async def _close_at_loop_shutdown(session: "aiohttp.ClientSession") -> AsyncIterator[None]:
+    """Park until the event loop finalizes async generators, then close `session`.
+
+    Event loops offer no close callback, but `loop.shutdown_asyncgens()` runs while the
+    loop is still alive, which the connector needs to close its transports cleanly.
+    """
+
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+def _is_retryable(status_code: int) -> bool:
+    """Whether a webhook response status is worth retrying (rate limit or server error)."""
+    return status_code == 429 or 500 <= status_code < 600
 
 
 class SlackNotificationService:
@@ -43,8 +329,59 @@ class SlackNotificationService:
     verbose: bool
     """Enable detailed logging of Slack operations."""
 
-    channels: Dict[str, WebhookClient]
-    """Mapping of channel references to WebhookClient instances."""
+    max_retries: int
+    """Number of times a rate-limited (429) or 5xx send is retried before failing."""
+
+    retry_backoff: float
+    """Base delay (in seconds) for exponential backoff between retries."""
+
+    latency_target: float
+    """Request latency (in seconds) under which successful sends raise the concurrency limit."""
+
+    coalesce_window_ms: int
+    """Window (in milliseconds) over which messages to one channel are merged; 0 disables."""
+
+    _pending: Dict[str, List[List[Dict[str, Any]]]]
+    """Messages waiting for their channel's coalescing window to elapse."""
+
+    _flush_timers: Dict[str, threading.Timer]
+    """Scheduled flushes for channels with pending messages."""
+
+    _aimd: AIMDLimiter
+    """Adaptive limit on concurrent webhook requests across all channels."""
+
+    channels: Dict[str, PooledWebhookClient]
+    """Mapping of channel references to PooledWebhookClient instances, built on first use."""
+
+    _pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool]
+    """Persistent connection pools shared by channels, keyed by (scheme, host, port)."""
+
+    _buckets: Dict[str, TokenBucket]
+    """Per-channel token buckets pacing sends; channels without a rate limit are absent."""
+
+    _breakers: Dict[str, CircuitBreaker]
+    """Per-channel circuit breakers; empty when `circuit_failure_threshold` is 0."""
+
+    _urls: Dict[str, str]
+    """Mapping of channel references to webhook URLs."""
+
+    _async_channels: Dict[str, "AsyncWebhookClient"]
+    """Mapping of channel references to AsyncWebhookClient instances, built on first use."""
+
+    _async_session: Optional["aiohttp.ClientSession"] = None
+    """Shared aiohttp session used by all async channels (HTTP keep-alive)."""
+
+    _async_loop: Optional[asyncio.AbstractEventLoop] = None
+    """Event loop `_async_session` was created in; the session is unusable on any other."""
+
+    _async_session_closer: Optional[AsyncIterator[None]] = None
+    """Async generator that closes `_async_session` when its event loop shuts down."""
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    """Thread pool used by `send_message_many`, created on first broadcast."""
+
+    _lazy_lock: threading.Lock
+    """Guards lazy creation of webhook clients, connection pools and the thread pool."""
 
     def __init__(self, config: SlackNotificationServiceConfig) -> None:
         """Initialize the service with configuration.
@@ -54,12 +391,30 @@ class SlackNotificationService:
         """
         self.send_to_slack = config.send_to_slack
         self.verbose = config.verbose
+        self.max_retries = config.max_retries
+        self.retry_backoff = config.retry_backoff
+        self.latency_target = config.latency_target
+        # Start wide open and only back off once Slack shows signs of congestion
+        self._aimd = AIMDLimiter(limit=config.max_concurrency, max_limit=config.max_concurrency)
+        self.coalesce_window_ms = config.coalesce_window_ms
+        self._circuit_failure_threshold = config.circuit_failure_threshold
+        self._circuit_cooldown = config.circuit_cooldown
+        self._http2 = config.http2
+        self._pending = {}
+        self._flush_timers = {}
+        self._coalesce_lock = threading.Lock()
+        self._lazy_lock = threading.Lock()
         self.load_channel_webhooks(config.channels)
 
     def load_channel_webhooks(self, channel_configs: List[SlackChannelConfig]) -> None:
         """Load and validate Slack channel webhook configurations.
 
-        Validates no duplicate channel references exist and creates WebhookClient instances.
+        Validates no duplicate channel references exist and records each channel's webhook
+        URL. PooledWebhookClient instances are created lazily by `get_webhook`; channels on
+        the same host share one keep-alive connection pool (a single multiplexed HTTP/2
+        connection when `http2` is enabled). Channels with a `rate_per_sec` get a token
+        bucket that paces sends client-side, and every channel gets a circuit
+        breaker unless `circuit_failure_threshold` is 0.
 
         Args:
             channel_configs: List of channel configuration objects.
@@ -68,184 +423,637 @@ class SlackNotificationService:
             SlackNotificationChannelDuplicateReferenceException: If duplicate channel refs found.
         """
 
-        channel_refs = [cc.channel_reference for cc in channel_configs]
-        if len(channel_refs) != len(set(channel_refs)):
-            raise SlackNotificationChannelDuplicateReferenceException(channel_refs)
+        reference_counts = Counter(cc.channel_reference for cc in channel_configs)
+        duplicate_refs = [ref for ref, count in reference_counts.items() if count > 1]
+        if duplicate_refs:
+            raise SlackNotificationChannelDuplicateReferenceException(duplicate_refs)
+
+        urls = {cc.channel_reference: cc.channel_webhook_url for cc in channel_configs}
 
-        self.channels = {
-            cc.channel_reference: WebhookClient(cc.channel_webhook_url) for cc in channel_configs
+        self._urls = urls
+        self._pools = {}
+        self.channels = {}
+        self._buckets = {
+            cc.channel_reference: TokenBucket(cc.rate_per_sec, cc.burst)
+            for cc in channel_configs
+            if cc.rate_per_sec
         }
+        self._breakers = (
+            {
+                reference: CircuitBreaker(self._circuit_failure_threshold, self._circuit_cooldown)
+                for reference in urls
+            }
+            if self._circuit_failure_threshold > 0
+            else {}
+        )
+        self._async_channels = {}
 
         if self.verbose:
             logger.info(
-                "SlackNotificationService initialized with the following channels: "
-                f"{', '.join(list(self.channels.keys()))}"
+                "SlackNotificationService initialized with the following channels: %s",
+                ", ".join(self._urls),
             )
 
-    def get_webhook(self, channel_reference: str) -> WebhookClient:
-        """Retrieve WebhookClient for specified channel.
+    def get_webhook(self, channel_reference: str) -> PooledWebhookClient:
+        """Retrieve PooledWebhookClient for specified channel.
 
         Args:
             channel_reference: Unique identifier for the Slack channel.
 
         Returns:
-            WebhookClient instance for the channel.
+            PooledWebhookClient instance for the channel.
 
         Raises:
             SlackNotificationChannelNotFoundException: If channel not configured.
         """
 
         channel_webhook = self.channels.get(channel_reference)
-        if channel_webhook is None:
+        if channel_webhook is not None:
+            return channel_webhook
+
+        url = self._urls.get(channel_reference)
+        if url is None:
             raise SlackNotificationChannelNotFoundException(channel_reference)
+
+        # Concurrent first sends must share one pool per host, or the extras would leak
+        with self._lazy_lock:
+            channel_webhook = self.channels.get(channel_reference)
+            if channel_webhook is None:
+                pool = pool_for_url(self._pools, url, len(self._urls), http2=self._http2)
+                channel_webhook = PooledWebhookClient(url, pool=pool)
+                self.channels[channel_reference] = channel_webhook
         return channel_webhook
 
     def send_message_to_slack(self, reference: str, blocks: List[Dict[str, Any]]) -> None:
         """Send message blocks to Slack channel via webhook.
 
+        Sends are paced by the channel's token bucket, if any, and rejected without a
+        request while the channel's circuit breaker is open. Rate-limited (429) and 5xx
+        responses are retried up to `max_retries` times.
+
         Args:
             reference: Channel reference identifier.
             blocks: List of Slack block dictionaries.
 
         Raises:
-            SlackNotificationSendFailedException: If HTTP response not 200.
+            SlackNotificationChannelNotFoundException: If channel not configured.
+            SlackNotificationChannelCircuitOpenException: If the channel's breaker is open.
+            SlackNotificationSendFailedException: If HTTP response not 200 once retries are
+                exhausted.
         """
 
         webhook = self.get_webhook(reference)
-        response = webhook.send(blocks=blocks)
-
-        if response.status_code != 200:
-            raise SlackNotificationSendFailedException(
-                reference, response.status_code, response.body
-            )
+        response = self._send_guarded(reference, lambda: webhook.send(blocks=blocks))
+        self._check_response(reference, response)
 
-        if self.verbose:
-            logger.info(
-                f"Message sent successfully to {reference} channel. Slack response:"
-                f" {response.status_code} - {response.body}"
-            )
+    def _send_guarded(self, reference: str, send: Callable[[], WebhookResponse]) -> WebhookResponse:
+        """Run `send` with retries behind the channel's circuit breaker and token bucket.
 
-    def send_dummy_message(self, reference: str, blocks: List[Dict[str, Any]]) -> None:
-        """Log message blocks instead of sending to Slack (dry-run mode).
+        Server errors and transport errors count as breaker failures, 200 responses as
+        successes; other responses (rate limits, client errors) and other exceptions leave
+        the breaker as is.
 
         Args:
             reference: Channel reference identifier.
-            blocks: List of Slack block dictionaries to log.
+            send: Callable performing a single webhook request.
+
+        Returns:
+            The last response received.
+
+        Raises:
+            SlackNotificationChannelCircuitOpenException: If the channel's breaker is open.
         """
 
-        logger.info(f"[DUMMY SLACK MESSAGE] {reference} : {blocks}")
+        breaker = self._allow_request(reference)
 
-    def send_message(self, reference: str, blocks: List[Dict[str, Any]]) -> None:
-        """Send message to Slack channel or log as dummy based on configuration.
+        bucket = self._buckets.get(reference)
+        if bucket is not None:
+            bucket.acquire()
+
+        try:
+            response = self._retry(reference, send)
+        except TRANSPORT_ERRORS:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        except Exception:
+            # Not the channel's fault (e.g. an unserializable payload); just free the probe
+            if breaker is not None:
+                breaker.record_neutral()
+            raise
+
+        self._record_response(breaker, response)
+        return response
+
+    def _allow_request(self, reference: str) -> Optional[CircuitBreaker]:
+        """Check the channel's circuit breaker before sending.
 
         Args:
             reference: Channel reference identifier.
-            blocks: List of Slack block dictionaries.
+
+        Returns:
+            The channel's breaker, or None when circuit breaking is disabled.
+
+        Raises:
+            SlackNotificationChannelCircuitOpenException: If the channel's breaker is open.
         """
 
-        if self.send_to_slack:
-            self.send_message_to_slack(reference, blocks)
-            return
-        self.send_dummy_message(reference, blocks)
+        breaker = self._breakers.get(reference)
+        if breaker is not None and not breaker.allow_request():
+            raise SlackNotificationChannelCircuitOpenException(reference, breaker.retry_in())
+        return breaker
+
+    @staticmethod
+    def _record_response(breaker: Optional[CircuitBreaker], response: WebhookResponse) -> None:
+        """Feed the final response of a guarded send back to the channel's breaker."""
 
-    def generic_message_blocks(self, title: str, message: str) -> List[Dict[str, Any]]:
-        """Create simple title + message Slack block layout.
+        if breaker is not None:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            elif response.status_code == 200:
+                breaker.record_success()
+            else:
+                breaker.record_neutral()
+
+    def _send_raw_to_slack(self, reference: str, raw_body: bytes) -> None:
+        """Send a pre-serialized payload with the same guards as `send_message_to_slack`."""
+
+        webhook = self.get_webhook(reference)
+        response = self._send_guarded(reference, lambda: webhook.send_raw(raw_body))
+        self._check_response(reference, response)
+
+    def _retry(self, reference: str, send: Callable[[], WebhookResponse]) -> WebhookResponse:
+        """Call `send` until it succeeds, fails permanently, or retries are exhausted.
+
+        A 429 response waits for the advertised `Retry-After` delay; 5xx responses (and
+        429 responses without a usable `Retry-After`) use exponential backoff with jitter.
+        Every attempt runs under the AIMD concurrency limiter.
 
         Args:
-            title: Bold title text.
-            message: Message body text.
+            reference: Channel reference identifier, used for logging.
+            send: Callable performing a single webhook request.
 
         Returns:
-            List containing single section block with formatted title and message.
+            The last response received.
         """
-        return [
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": f"*{title}*\n{message}"},
-            },
-        ]
 
-    def divider_block(self) -> Dict[str, Any]:
-        """Create horizontal divider Slack block."""
-        return {"type": "divider"}
+        attempt = 0
+        while True:
+            response = self._send_limited(send)
+            if attempt >= self.max_retries or not _is_retryable(response.status_code):
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            attempt += 1
+            self._log_retry(reference, response, delay, attempt)
+            time.sleep(delay)
+
+    def _send_limited(self, send: Callable[[], WebhookResponse]) -> WebhookResponse:
+        """Perform one request under the AIMD limiter and feed the outcome back to it.
 
-    def section_block(self, text: str) -> Dict[str, Any]:
-        """Create section block with mrkdwn text.
+        Only transport errors lower the limit; any other exception is the caller's problem
+        rather than a sign of congestion.
 
         Args:
-            text: Text content supporting Slack mrkdwn formatting.
+            send: Callable performing a single webhook request.
 
         Returns:
-            Section block dictionary.
+            Response returned by `send`.
         """
-        return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
 
-    def url_link(self, text: str, url: str) -> str:
-        """Format Slack link syntax: <url|text>.
+        self._aimd.acquire()
+        try:
+            started = time.perf_counter()
+            try:
+                response = send()
+            except TRANSPORT_ERRORS:
+                self._aimd.decrease()
+                raise
+            elapsed = time.perf_counter() - started
+        finally:
+            self._aimd.release()
+
+        if _is_retryable(response.status_code):
+            self._aimd.decrease()
+        elif response.status_code == 200 and elapsed <= self.latency_target:
+            self._aimd.increase()
+        return response
+
+    def _log_retry(
+        self, reference: str, response: WebhookResponse, delay: float, attempt: int
+    ) -> None:
+        """Log an upcoming retry when running verbosely."""
+
+        if self.verbose:
+            logger.info(
+                "Slack responded %s for %s channel, retrying in %.2fs (attempt %d/%d)",
+                response.status_code,
+                reference,
+                delay,
+                attempt,
+                self.max_retries,
+            )
+
+    def _retry_delay(self, response: WebhookResponse, attempt: int) -> float:
+        """Compute how long to wait before retrying after `response`.
 
         Args:
-            text: Display text for link.
-            url: Target URL.
+            response: Retryable response.
+            attempt: Zero-based number of the attempt that produced `response`.
 
         Returns:
-            Slack-formatted link string.
+            Delay in seconds.
         """
-        return f"<{url}|{text}>"
 
-    def list_items(self, items: List[str]) -> str:
-        """Format bullet list for Slack mrkdwn.
+        if response.status_code == 429:
+            retry_after = (response.headers or {}).get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    pass
+        return self.retry_backoff * 2.0**attempt + random.uniform(0, self.retry_backoff)
+
+    def _check_response(self, reference: str, response: WebhookResponse) -> None:
+        """Validate a Slack webhook response.
 
         Args:
-            items: List of strings to bulletize.
+            reference: Channel reference identifier.
+            response: Response returned by the webhook client.
 
-        Returns:
-            Newline-separated bullet list string.
+        Raises:
+            SlackNotificationSendFailedException: If HTTP response not 200.
+        """
+
+        if response.status_code != 200:
+            raise SlackNotificationSendFailedException(
+                reference, response.status_code, response.body
+            )
+
+        if self.verbose:
+            logger.info(
+                "Message sent successfully to %s channel. Slack response: %s - %s",
+                reference,
+                response.status_code,
+                response.body,
+            )
+
+    def _get_async_session(self) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session, creating it on first use.
+
+        The session must be created inside a running event loop, so it is built lazily
+        rather than in `__init__`. A session is bound to the loop it was created in, so a
+        new one is built when called from a different loop (e.g. a later `asyncio.run`).
+        Async channel clients are rebuilt whenever a new session is created.
+
+        Each session is closed when its loop finalizes async generators, as `asyncio.run`
+        does before closing the loop, so replaced sessions do not leak their connections.
+        Loops driven by hand must call `loop.shutdown_asyncgens()` (or `aclose`) first.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
         """
-        return "\n".join([f"• {item}" for item in items])
 
-    def list_items_numbered(self, items: List[str]) -> str:
-        """Format numbered list for Slack mrkdwn.
+        if aiohttp is None:
+            raise ImportError(
+                "Async sending requires aiohttp. "
+                "Install it with `pip install slack-notifications-python[async]`."
+            )
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._async_session is None
+            or self._async_session.closed
+            or self._async_loop is not loop
+        ):
+            connector = aiohttp.TCPConnector(
+                limit=ASYNC_CONNECTION_LIMIT, keepalive_timeout=ASYNC_KEEPALIVE_TIMEOUT
+            )
+            self._async_session = aiohttp.ClientSession(connector=connector)
+            self._async_loop = loop
+            self._async_channels = {}
+            self._async_session_closer = _close_at_loop_shutdown(self._async_session)
+            # Advance it to its `yield` so the loop tracks it and finalizes it on shutdown
+            asyncio.ensure_future(anext(self._async_session_closer))
+        return self._async_session
+
+    def get_async_webhook(self, channel_reference: str) -> "AsyncWebhookClient":
+        """Retrieve AsyncWebhookClient for specified channel.
 
         Args:
-            items: List of strings to number.
+            channel_reference: Unique identifier for the Slack channel.
 
         Returns:
-            Newline-separated numbered list string.
+            AsyncWebhookClient instance bound to the shared aiohttp session.
+
+        Raises:
+            SlackNotificationChannelNotFoundException: If channel not configured.
         """
-        return "\n".join([f"{i + 1}. {item}" for i, item in enumerate(items)])
 
-    def bold_text(self, text: str) -> str:
-        """Wrap text in Slack bold mrkdwn (*text*).
+        url = self._urls.get(channel_reference)
+        if url is None:
+            raise SlackNotificationChannelNotFoundException(channel_reference)
+
+        session = self._get_async_session()
+        channel_webhook = self._async_channels.get(channel_reference)
+        if channel_webhook is None:
+            channel_webhook = AsyncWebhookClient(url, session=session)
+            self._async_channels[channel_reference] = channel_webhook
+        return channel_webhook
+
+    async def send_message_async(self, reference: str, blocks: List[Dict[str, Any]]) -> None:
+        """Asynchronously send message to Slack channel or log as dummy.
+
+        Applies the same circuit breaker, token bucket and retry policy as
+        `send_message_to_slack`, waiting with `asyncio.sleep` instead of blocking the loop.
 
         Args:
-            text: Text to bold.
+            reference: Channel reference identifier.
+            blocks: List of Slack block dictionaries.
 
-        Returns:
-            Bold-formatted string.
+        Raises:
+            SlackNotificationChannelCircuitOpenException: If the channel's breaker is open.
+            SlackNotificationSendFailedException: If HTTP response not 200 once retries are
+                exhausted.
         """
-        return f"*{text}*"
 
-    def italic_text(self, text: str) -> str:
-        """Wrap text in Slack italic mrkdwn (_text_).
+        if not self.send_to_slack:
+            self.send_dummy_message(reference, blocks)
+            return
+
+        webhook = self.get_async_webhook(reference)
+        response = await self._send_guarded_async(reference, lambda: webhook.send(blocks=blocks))
+        self._check_response(reference, response)
+
+    async def _send_guarded_async(
+        self, reference: str, send: Callable[[], Awaitable[WebhookResponse]]
+    ) -> WebhookResponse:
+        """Async counterpart of `_send_guarded`, with the same breaker, bucket and retries.
+
+        Attempts do not go through the AIMD limiter, which blocks threads; concurrency is
+        bounded by the aiohttp session's connection limit instead.
 
         Args:
-            text: Text to italicize.
+            reference: Channel reference identifier.
+            send: Callable returning an awaitable that performs a single webhook request.
 
         Returns:
-            Italic-formatted string.
+            The last response received.
+
+        Raises:
+            SlackNotificationChannelCircuitOpenException: If the channel's breaker is open.
         """
-        return f"_{text}_"
 
-    def footer_block(self, footer_message: str) -> Dict[str, Any]:
-        """Create footer context block with mrkdwn text.
+        breaker = self._allow_request(reference)
+
+        bucket = self._buckets.get(reference)
+        if bucket is not None:
+            wait = bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        attempt = 0
+        try:
+            while True:
+                response = await send()
+                if attempt >= self.max_retries or not _is_retryable(response.status_code):
+                    break
+
+                delay = self._retry_delay(response, attempt)
+                attempt += 1
+                self._log_retry(reference, response, delay, attempt)
+                await asyncio.sleep(delay)
+        except ASYNC_TRANSPORT_ERRORS:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        except Exception:
+            if breaker is not None:
+                breaker.record_neutral()
+            raise
+
+        self._record_response(breaker, response)
+        return response
+
+    async def send_messages_async(self, messages: List[Tuple[str, List[Dict[str, Any]]]]) -> None:
+        """Concurrently send several messages over the shared aiohttp session.
 
         Args:
-            footer_message: Text to display in footer.
+            messages: List of (channel reference, blocks) pairs.
 
-        Returns:
-            Context block dictionary with footer message.
+        Raises:
+            SlackNotificationSendFailedException: If any HTTP response not 200.
         """
-        return {
-            "type": "context",
-            "elements": [{"type": "mrkdwn", "text": footer_message}],
-        }
+
+        await asyncio.gather(
+            *(self.send_message_async(reference, blocks) for reference, blocks in messages)
+        )
+
+    def close(self) -> None:
+        """Flush coalesced messages, then release the thread pool and connection pools.
+
+        Webhook clients and pools are dropped along with their connections, so the service
+        stays usable: later sends rebuild them lazily.
+        """
+
+        try:
+            self.flush()
+        finally:
+            with self._lazy_lock:
+                executor, self._executor = self._executor, None
+                pools, self._pools = self._pools, {}
+                self.channels = {}
+            if executor is not None:
+                executor.shutdown(wait=True)
+            for pool in pools.values():
+                pool.close()
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp session, if one was opened."""
+
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_loop = None
+        self._async_session_closer = None
+        self._async_channels = {}
+
+    def send_dummy_message(self, reference: str, blocks: List[Dict[str, Any]]) -> None:
+        """Log message blocks instead of sending to Slack (dry-run mode).
+
+        Args:
+            reference: Channel reference identifier.
+            blocks: List of Slack block dictionaries to log.
+        """
+
+        if logger.isEnabledFor(INFO):
+            logger.info("[DUMMY SLACK MESSAGE] %s : %s", reference, blocks)
+
+    def send_message(self, reference: str, blocks: List[Dict[str, Any]]) -> None:
+        """Send message to Slack channel or log as dummy based on configuration.
+
+        When `coalesce_window_ms` is set, the message is queued instead and merged with
+        other messages sent to the same channel within the window (see `flush`).
+
+        Args:
+            reference: Channel reference identifier.
+            blocks: List of Slack block dictionaries.
+
+        Raises:
+            SlackNotificationChannelNotFoundException: If coalescing and channel not configured.
+        """
+
+        if self.coalesce_window_ms > 0:
+            self._enqueue(reference, blocks)
+            return
+        self._deliver(reference, blocks)
+
+    def _deliver(self, reference: str, blocks: List[Dict[str, Any]]) -> None:
+        """Send message blocks immediately, to Slack or as a dummy message."""
+
+        if self.send_to_slack:
+            self.send_message_to_slack(reference, blocks)
+            return
+        self.send_dummy_message(reference, blocks)
+
+    def _enqueue(self, reference: str, blocks: List[Dict[str, Any]]) -> None:
+        """Queue a message and schedule its channel's flush if none is pending."""
+
+        if self.send_to_slack and reference not in self._urls:
+            raise SlackNotificationChannelNotFoundException(reference)
+
+        with self._coalesce_lock:
+            # Copy, as callers may reuse or clear their list once send_message returns
+            self._pending.setdefault(reference, []).append(list(blocks))
+            if reference not in self._flush_timers:
+                timer = threading.Timer(
+                    self.coalesce_window_ms / 1000, self._flush_in_background, args=(reference,)
+                )
+                timer.daemon = True
+                self._flush_timers[reference] = timer
+                timer.start()
+
+    def _flush_in_background(self, reference: str) -> None:
+        """Timer callback flushing one channel; errors are logged as there is no caller."""
+
+        try:
+            self._flush_channel(reference)
+        except Exception:
+            logger.exception("Failed to send coalesced Slack messages to %s channel", reference)
+
+    def _flush_channel(self, reference: str) -> None:
+        """Send all pending messages for a channel, merged into as few sends as possible.
+
+        Messages are separated by a divider block, and a new send is started whenever the
+        merged message would exceed Slack's block limit. Every merged message is attempted
+        even if an earlier one fails; the first failure is raised afterwards.
+        """
+
+        with self._coalesce_lock:
+            messages = self._pending.pop(reference, [])
+            timer = self._flush_timers.pop(reference, None)
+        if timer is not None:
+            timer.cancel()
+
+        chunks: List[List[Dict[str, Any]]] = []
+        merged: List[Dict[str, Any]] = []
+        for blocks in messages:
+            separator = 1 if merged else 0
+            if merged and len(merged) + separator + len(blocks) > SLACK_MAX_BLOCKS:
+                chunks.append(merged)
+                merged, separator = [], 0
+            if separator:
+                merged.append(_DIVIDER_BLOCK.copy())
+            merged.extend(blocks)
+        if merged:
+            chunks.append(merged)
+
+        errors: List[Exception] = []
+        for chunk in chunks:
+            try:
+                self._deliver(reference, chunk)
+            except Exception as e:
+                errors.append(e)
+        _raise_first(errors)
+
+    def flush(self) -> None:
+        """Immediately send every message still waiting in a coalescing window.
+
+        Every channel is flushed even if another fails; the first failure is raised
+        afterwards and any others are logged.
+
+        Raises:
+            SlackNotificationSendFailedException: If a merged message fails to send.
+        """
+
+        with self._coalesce_lock:
+            references = list(self._pending)
+        errors: List[Exception] = []
+        for reference in references:
+            try:
+                self._flush_channel(reference)
+            except Exception as e:
+                errors.append(e)
+        _raise_first(errors)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the broadcast thread pool, sized to the channel count, creating it if needed."""
+
+        with self._lazy_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=min(32, max(1, len(self._urls))),
+                    thread_name_prefix="slack-notifications",
+                )
+            return self._executor
+
+    def send_message_many(self, references: List[str], blocks: List[Dict[str, Any]]) -> None:
+        """Send the same message to several channels concurrently.
+
+        Channels are sent to on a shared thread pool, so total time is bounded by the slowest
+        channel rather than the sum of all of them. When sending straight to Slack the
+        payload is serialized once and the same bytes are posted to every channel; in
+        dry-run or coalescing mode each channel goes through `send_message`.
+
+        Args:
+            references: Channel reference identifiers.
+            blocks: List of Slack block dictionaries.
+
+        Raises:
+            SlackNotificationBroadcastFailedException: If sending to any channel failed,
+                after all channels have been attempted.
+        """
+
+        executor = self._get_executor()
+        if self.send_to_slack and self.coalesce_window_ms <= 0:
+            raw_body = encode_blocks(blocks)
+            futures: Dict[Future[None], str] = {
+                executor.submit(self._send_raw_to_slack, reference, raw_body): reference
+                for reference in references
+            }
+        else:
+            futures = {
+                executor.submit(self.send_message, reference, blocks): reference
+                for reference in references
+            }
+
+        errors: Dict[str, Exception] = {}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                errors[futures[future]] = e
+
+        if errors:
+            raise SlackNotificationBroadcastFailedException(errors)
+
+    # Block-building helpers, kept as methods for backward compatibility
+    generic_message_blocks = staticmethod(generic_message_blocks)
+    divider_block = staticmethod(divider_block)
+    section_block = staticmethod(section_block)
+    url_link = staticmethod(url_link)
+    list_items = staticmethod(list_items)
+    list_items_numbered = staticmethod(list_items_numbered)
+    bold_text = staticmethod(bold_text)
+    italic_text = staticmethod(italic_text)
+    footer_block = staticmethod(footer_block)
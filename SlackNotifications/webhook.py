@@ -0,0 +1,451 @@
+import io
+import json
+import queue
+from abc import ABC, abstractmethod
+from http.client import (
+    HTTPConnection,
+    HTTPException,
+    HTTPMessage,
+    HTTPSConnection,
+    RemoteDisconnected,
+)
+from ssl import SSLContext
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request
+
+from slack_sdk.http_retry.request import HttpRequest as RetryHttpRequest
+from slack_sdk.http_retry.response import HttpResponse as RetryHttpResponse
+from slack_sdk.http_retry.state import RetryState
+from slack_sdk.webhook import WebhookClient
+from slack_sdk.webhook.internal_utils import _build_body
+from slack_sdk.webhook.webhook_response import WebhookResponse
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is an optional extra
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+_STALE_CONNECTION_ERRORS = (RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+"""Errors raised when a reused keep-alive connection was closed by the server while idle."""
+
+TRANSPORT_ERRORS: Tuple[Type[Exception], ...] = (OSError, HTTPException) + (
+    (httpx.TransportError,) if httpx is not None else ()
+)
+"""Errors raised when a webhook request failed in transit (connection, TLS, timeout)."""
+
+JSON_CONTENT_TYPE = "application/json;charset=utf-8"
+"""Content-Type sent with every webhook request."""
+
+
+def dumps(body: Dict[str, Any]) -> bytes:
+    """Serialize a webhook payload to compact UTF-8 JSON bytes.
+
+    Uses orjson when available, falling back to the stdlib encoder if orjson is missing or
+    rejects the payload (e.g. non-string keys or integers wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(body)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+def encode_blocks(blocks: Sequence[Any]) -> bytes:
+    """Serialize a blocks-only webhook payload, as `WebhookClient.send(blocks=...)` would."""
+    return dumps(_build_body({"blocks": blocks}) or {})
+
+
+class ConnectionPool(ABC):
+    """Thread-safe transport performing webhook requests over reusable connections to one host."""
+
+    timeout: float
+    """Timeout (in seconds) applied to requests made through the pool."""
+
+    ssl: Optional[SSLContext]
+    """SSL context for HTTPS connections, or None for the default context."""
+
+    @abstractmethod
+    def request(
+        self, method: str, path: str, body: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[int, str, HTTPMessage, bytes]:
+        """Perform a request over a pooled connection.
+
+        Args:
+            method: HTTP method.
+            path: Request path including any query string.
+            body: Request body.
+            headers: Request headers.
+
+        Returns:
+            Tuple of status code, reason phrase, response headers and response body.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the connections held by the pool."""
+
+
+class HTTPConnectionPool(ConnectionPool):
+    """Thread-safe pool of persistent (keep-alive) connections to a single host.
+
+    Connections are checked out for the duration of one request and returned afterwards,
+    so repeated sends reuse the TCP connection and TLS session instead of paying a new
+    handshake per message.
+    """
+
+    scheme: str
+    """URL scheme, either `http` or `https`."""
+
+    host: str
+    """Host name connections are opened to."""
+
+    port: Optional[int]
+    """Port connections are opened to, or None for the scheme default."""
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: Optional[int] = None,
+        maxsize: int = 1,
+        timeout: float = 30,
+        ssl: Optional[SSLContext] = None,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            scheme: URL scheme, either `http` or `https`.
+            host: Host name connections are opened to.
+            port: Port connections are opened to, or None for the scheme default.
+            maxsize: Maximum number of idle connections retained.
+            timeout: Socket timeout (in seconds) for new connections.
+            ssl: SSL context for HTTPS connections.
+        """
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.ssl = ssl
+        self._idle: "queue.LifoQueue[HTTPConnection]" = queue.LifoQueue(maxsize=max(1, maxsize))
+
+    def _new_connection(self) -> HTTPConnection:
+        """Open a new (not yet connected) connection to the pool's host."""
+        if self.scheme == "https":
+            return HTTPSConnection(self.host, self.port, timeout=self.timeout, context=self.ssl)
+        return HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _get_connection(self) -> Tuple[HTTPConnection, bool]:
+        """Check out an idle connection, or open a new one if none are available.
+
+        Returns:
+            Tuple of the connection and whether it was reused from the pool.
+        """
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._new_connection(), False
+
+    def _put_connection(self, conn: HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is already full."""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(
+        self, method: str, path: str, body: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[int, str, HTTPMessage, bytes]:
+        """Perform a request over a pooled connection.
+
+        A reused connection that turns out to have been closed by the server is
+        discarded and the request is retried once on a fresh connection.
+        """
+        conn, reused = self._get_connection()
+        while True:
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                http_resp = conn.getresponse()
+                data = http_resp.read()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                conn, reused = self._new_connection(), False
+                continue
+            except (OSError, HTTPException):
+                conn.close()
+                raise
+            break
+
+        if http_resp.will_close:
+            conn.close()
+        else:
+            self._put_connection(conn)
+        return http_resp.status, http_resp.reason, http_resp.headers, data
+
+    def close(self) -> None:
+        """Close all idle connections held by the pool."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class HTTP2ConnectionPool(ConnectionPool):
+    """Pool multiplexing every request to a host over one HTTP/2 connection via httpx.
+
+    Concurrent sends to different webhook paths on the same host share a single TCP/TLS
+    connection as separate HTTP/2 streams, instead of each holding a connection. If the
+    server does not negotiate HTTP/2, requests fall back to up to `maxsize` HTTP/1.1
+    keep-alive connections.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: Optional[int] = None,
+        maxsize: int = 1,
+        timeout: float = 30,
+        ssl: Optional[SSLContext] = None,
+    ) -> None:
+        """Initialize the pool and its httpx client.
+
+        Args:
+            scheme: URL scheme, either `http` or `https`.
+            host: Host name connections are opened to.
+            port: Port connections are opened to, or None for the scheme default.
+            maxsize: Maximum number of HTTP/1.1 connections if HTTP/2 is not negotiated.
+            timeout: Request timeout (in seconds).
+            ssl: SSL context for HTTPS connections.
+
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+        if httpx is None:
+            raise ImportError(
+                "HTTP/2 transport requires httpx. "
+                "Install it with `pip install slack-notifications-python[http2]`."
+            )
+        self.timeout = timeout
+        self.ssl = ssl
+        authority = f"{host}:{port}" if port is not None else host
+        # httpx queues HTTP/2 requests on the first connection rather than opening more,
+        # so the limit only matters for the HTTP/1.1 fallback
+        self._client = httpx.Client(
+            base_url=f"{scheme}://{authority}",
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max(1, maxsize), max_keepalive_connections=max(1, maxsize)
+            ),
+            timeout=timeout,
+            verify=ssl if ssl is not None else True,
+        )
+
+    def request(
+        self, method: str, path: str, body: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[int, str, HTTPMessage, bytes]:
+        http_resp = self._client.request(method, path, content=body, headers=headers)
+        message = HTTPMessage()
+        for name, value in http_resp.headers.multi_items():
+            message[name] = value
+        return http_resp.status_code, http_resp.reason_phrase, message, http_resp.content
+
+    def close(self) -> None:
+        """Close the underlying httpx client and its connection."""
+        self._client.close()
+
+
+class PooledWebhookClient(WebhookClient):
+    """WebhookClient that sends requests over a shared persistent connection pool.
+
+    slack_sdk's default transport opens a new urllib connection for every request. This
+    client performs the HTTP exchange on a connection checked out from `pool`, sending
+    a compact JSON body with request headers built once at construction. Requests made
+    through a proxy, or with per-call headers, fall back to slack_sdk's request building.
+    Either way, failed requests are offered to `retry_handlers` as slack_sdk would.
+    """
+
+    pool: ConnectionPool
+    """Connection pool shared with other clients for the same host."""
+
+    def __init__(self, url: str, pool: ConnectionPool, **kwargs: Any) -> None:
+        """Initialize the client.
+
+        The pooled transport uses the pool's `timeout` and `ssl`, so those default to the
+        pool's values and may not be set to anything else.
+
+        Args:
+            url: Complete webhook URL.
+            pool: Connection pool for the webhook URL's host.
+            **kwargs: Additional WebhookClient keyword arguments.
+
+        Raises:
+            ValueError: If `timeout` or `ssl` differ from the pool's.
+        """
+        for name in ("timeout", "ssl"):
+            if name in kwargs and kwargs[name] != getattr(pool, name):
+                raise ValueError(
+                    f"{name}={kwargs[name]!r} does not match the connection pool's "
+                    f"{name}={getattr(pool, name)!r}; set it when creating the pool instead."
+                )
+        kwargs.setdefault("timeout", pool.timeout)
+        kwargs.setdefault("ssl", pool.ssl)
+        super().__init__(url, **kwargs)
+        self.pool = pool
+        parts = urlsplit(url)
+        self._path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        self._headers = {**self.default_headers, "Content-Type": JSON_CONTENT_TYPE}
+
+    def send_dict(
+        self, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None
+    ) -> WebhookResponse:
+        if headers or self.proxy is not None:
+            response: WebhookResponse = super().send_dict(body, headers)
+            return response
+        return self.send_raw(dumps(_build_body(body) or {}))
+
+    def send_raw(self, raw_body: bytes) -> WebhookResponse:
+        """Send an already serialized JSON payload over the pool.
+
+        Errors and non-2xx responses are offered to `retry_handlers`, mirroring slack_sdk's
+        own request loop, so e.g. the default connection error retry still applies. With a
+        proxy configured the payload goes through slack_sdk's transport instead, as in
+        `send_dict`.
+
+        Args:
+            raw_body: UTF-8 encoded JSON payload.
+
+        Returns:
+            Webhook response, whatever its status code.
+        """
+        if self.proxy is not None:
+            response: WebhookResponse = super().send_dict(json.loads(raw_body))
+            return response
+
+        retry_state = RetryState()
+        while True:
+            retry_state.next_attempt_requested = False
+            try:
+                status, reason, headers, data = self.pool.request(
+                    "POST", self._path, body=raw_body, headers=self._headers
+                )
+            except Exception as err:
+                if not self._retry_requested(retry_state, raw_body, None, err):
+                    raise
+                continue
+
+            response = WebhookResponse(
+                url=self.url,
+                status_code=status,
+                body=data.decode(headers.get_content_charset() or "utf-8"),
+                headers=headers,  # type: ignore[arg-type]
+            )
+            if 200 <= status < 300:
+                return response
+            retry_response = RetryHttpResponse(
+                status_code=status,
+                headers={name: [value] for name, value in headers.items()},
+                data=data,
+            )
+            error = HTTPError(self.url, status, reason, headers, None)
+            if not self._retry_requested(retry_state, raw_body, retry_response, error):
+                return response
+
+    def _retry_requested(
+        self,
+        state: RetryState,
+        raw_body: bytes,
+        response: Optional[RetryHttpResponse],
+        error: Exception,
+    ) -> bool:
+        """Let the first retry handler that accepts a failed request prepare another attempt.
+
+        Args:
+            state: Retry state shared by every attempt of the request.
+            raw_body: UTF-8 encoded JSON payload of the request.
+            response: Error response, or None if the request raised.
+            error: Error raised by, or representing, the failed attempt.
+
+        Returns:
+            Whether another attempt should be made.
+        """
+        request = RetryHttpRequest(
+            method="POST",
+            url=self.url,
+            headers=self._headers,  # type: ignore[arg-type]
+            data=raw_body,
+        )
+        for handler in self.retry_handlers:
+            if handler.can_retry(state=state, request=request, response=response, error=error):
+                handler.prepare_for_next_attempt(
+                    state=state, request=request, response=response, error=error
+                )
+                break
+        return state.next_attempt_requested
+
+    def _perform_http_request_internal(self, url: str, req: Request) -> WebhookResponse:
+        if self.proxy is not None:
+            response: WebhookResponse = super()._perform_http_request_internal(url, req)
+            return response
+
+        status, reason, headers, data = self.pool.request(
+            "POST",
+            self._path,
+            body=req.data,  # type: ignore[arg-type]
+            headers=dict(req.header_items()),
+        )
+        if not 200 <= status < 300:
+            # Mirror urlopen so slack_sdk's retry handlers see the usual HTTPError
+            raise HTTPError(url, status, reason, headers, io.BytesIO(data))
+
+        charset = headers.get_content_charset() or "utf-8"
+        return WebhookResponse(
+            url=url,
+            status_code=status,
+            body=data.decode(charset),
+            headers=headers,  # type: ignore[arg-type]
+        )
+
+
+def pool_for_url(
+    pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool],
+    url: str,
+    maxsize: int,
+    http2: bool = False,
+    timeout: float = 30,
+    ssl: Optional[SSLContext] = None,
+) -> ConnectionPool:
+    """Return the pool for a URL's origin from `pools`, creating it if missing.
+
+    Not thread-safe: callers sharing `pools` between threads must serialize calls.
+
+    Args:
+        pools: Mapping of (scheme, host, port) to connection pools.
+        url: URL whose origin the pool should connect to.
+        maxsize: Maximum number of connections retained by a newly created pool.
+        http2: Create an HTTP2ConnectionPool (requires httpx) rather than an
+            HTTP/1.1 keep-alive pool.
+        timeout: Request timeout (in seconds) for a newly created pool.
+        ssl: SSL context for a newly created pool, or None for the default context.
+
+    Returns:
+        Connection pool for the URL's origin.
+    """
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.hostname or "", parts.port)
+    pool = pools.get(key)
+    if pool is None:
+        pool_class = HTTP2ConnectionPool if http2 else HTTPConnectionPool
+        pool = pool_class(parts.scheme, key[1], key[2], maxsize=maxsize, timeout=timeout, ssl=ssl)
+        pools[key] = pool
+    return pool
@@ -0,0 +1,49 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+
+import pytest
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    status = 200
+    drop_idle = False
+    barrier: Optional[threading.Barrier] = None
+    requests: List[Tuple[str, int, bytes]] = []
+    headers_seen: List[Dict[str, str]] = []
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.barrier is not None:
+            # Hold the response until the expected number of requests are in flight at once
+            self.barrier.wait()
+        # Record the client port so tests can tell whether the connection was reused
+        self.requests.append((self.path, self.client_address[1], body))
+        self.headers_seen.append({k.lower(): v for k, v in self.headers.items()})
+        payload = b"ok" if self.status == 200 else b"internal_error"
+        self.send_response(self.status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        # Close without announcing it, as a server timing out an idle keep-alive would
+        self.close_connection = self.drop_idle
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def webhook_server() -> Iterator[Tuple[str, Type[_WebhookHandler]]]:
+    class Handler(_WebhookHandler):
+        requests: List[Tuple[str, int, bytes]] = []
+        headers_seen: List[Dict[str, str]] = []
+
+    handler = Handler
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", handler
+    server.shutdown()
+    server.server_close()
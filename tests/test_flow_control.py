@@ -0,0 +1,188 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from SlackNotifications.flow_control import AIMDLimiter, CircuitBreaker, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr("SlackNotifications.flow_control.time.monotonic", fake.monotonic)
+    monkeypatch.setattr("SlackNotifications.flow_control.time.sleep", fake.sleep)
+    return fake
+
+
+class TestTokenBucket:
+    def test_first_acquire_does_not_wait(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=1.0)
+
+        assert bucket.acquire() == 0.0
+        assert clock.sleeps == []
+
+    def test_acquire_waits_for_refill(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=2.0)
+
+        bucket.acquire()
+        waited = bucket.acquire()
+
+        assert waited == pytest.approx(0.5)
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_burst_allows_capacity_without_waiting(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(1.0)
+
+    def test_tokens_refill_while_idle(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=1.0)
+
+        bucket.acquire()
+        clock.now += 5
+        assert bucket.acquire() == 0.0
+
+    def test_concurrent_waiters_reserve_successive_tokens(
+        self, clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bucket = TokenBucket(rate=1.0)
+        bucket.acquire()
+
+        # Two callers arriving together while empty queue up one interval apart
+        monkeypatch.setattr("SlackNotifications.flow_control.time.sleep", clock.sleeps.append)
+        first = bucket.acquire()
+        second = bucket.acquire()
+
+        assert first == pytest.approx(1.0)
+        assert second == pytest.approx(2.0)
+
+
+class TestAIMDLimiter:
+    def test_increase_is_additive_and_capped(self) -> None:
+        limiter = AIMDLimiter(limit=1, max_limit=2, alpha=0.5)
+
+        limiter.increase()
+        assert limiter.limit == 1.5
+        limiter.increase()
+        limiter.increase()
+        assert limiter.limit == 2
+
+    def test_decrease_is_multiplicative_and_floored(self) -> None:
+        limiter = AIMDLimiter(limit=8, min_limit=1, beta=0.5)
+
+        limiter.decrease()
+        assert limiter.limit == 4
+        for _ in range(5):
+            limiter.decrease()
+        assert limiter.limit == 1
+
+    def test_acquire_blocks_at_limit_until_release(self) -> None:
+        limiter = AIMDLimiter(limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker() -> None:
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+
+        limiter.release()
+        assert acquired.wait(timeout=1)
+        assert limiter.in_flight == 1
+
+    def test_increase_wakes_waiters(self) -> None:
+        limiter = AIMDLimiter(limit=1, alpha=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker() -> None:
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        time.sleep(0.05)
+        limiter.increase()
+
+        assert acquired.wait(timeout=1)
+        assert limiter.in_flight == 2
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_consecutive_failures(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=10)
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.retry_in() == pytest.approx(10)
+
+    def test_success_resets_failure_count(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_probe_after_cooldown(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+        breaker.record_failure()
+
+        clock.now += 10
+        assert breaker.allow_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=5, cooldown=10)
+        for _ in range(5):
+            breaker.record_failure()
+
+        clock.now += 10
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.retry_in() == pytest.approx(10)
+
+    def test_neutral_result_frees_probe(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+        breaker.record_failure()
+        clock.now += 10
+        assert breaker.allow_request()
+
+        breaker.record_neutral()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
@@ -1,19 +1,32 @@
+import asyncio
+import json
 import logging
-from typing import Any, Dict, List
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from dataclasses import FrozenInstanceError, replace
+from typing import Any, Dict, List, Tuple, Type
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from SlackNotifications import slack
 from SlackNotifications.exceptions import (
+    SlackNotificationBroadcastFailedException,
+    SlackNotificationChannelCircuitOpenException,
     SlackNotificationChannelDuplicateReferenceException,
     SlackNotificationChannelNotFoundException,
     SlackNotificationSendFailedException,
 )
+from SlackNotifications.flow_control import CircuitBreaker
 from SlackNotifications.slack import (
+    MessageBuilder,
     SlackChannelConfig,
     SlackNotificationService,
     SlackNotificationServiceConfig,
 )
+from SlackNotifications.slack import logger as slack_logger
+from SlackNotifications.webhook import HTTP2ConnectionPool, HTTPConnectionPool
+from tests.conftest import _WebhookHandler
 
 
 @pytest.fixture
@@ -46,21 +59,61 @@ def service_for_helpers(service_config: SlackNotificationServiceConfig) -> Slack
 
 
 class TestInitialization:
-    @patch("SlackNotifications.slack.WebhookClient")
-    def test_init_creates_webhook_clients(
+    @patch("SlackNotifications.slack.PooledWebhookClient")
+    def test_webhook_clients_created_on_first_use(
         self,
         mock_webhook_client: MagicMock,
         service_config: SlackNotificationServiceConfig,
         channel_configs: List[SlackChannelConfig],
     ) -> None:
-        SlackNotificationService(service_config)
+        service = SlackNotificationService(service_config)
 
-        # One WebhookClient per channel config
+        # Clients are built lazily, one per channel config
+        assert mock_webhook_client.call_count == 0
+        for cc in channel_configs:
+            service.get_webhook(cc.channel_reference)
+            service.get_webhook(cc.channel_reference)
         assert mock_webhook_client.call_count == len(channel_configs)
         urls_called = {call.args[0] for call in mock_webhook_client.call_args_list}
         assert urls_called == {cc.channel_webhook_url for cc in channel_configs}
 
-    @patch("SlackNotifications.slack.WebhookClient")
+    def test_concurrent_first_use_shares_one_pool(
+        self,
+        channel_configs: List[SlackChannelConfig],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        class SlowPool(HTTPConnectionPool):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                time.sleep(0.01)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr("SlackNotifications.webhook.HTTPConnectionPool", SlowPool)
+        configs = channel_configs + [
+            SlackChannelConfig(f"extra{i}", f"https://hooks.slack.com/services/T000/A000/{i}")
+            for i in range(6)
+        ]
+        service = SlackNotificationService(SlackNotificationServiceConfig(channels=configs))
+        barrier = threading.Barrier(len(configs))
+
+        def first_use(reference: str) -> None:
+            barrier.wait()
+            service.get_webhook(reference)
+
+        threads = [
+            threading.Thread(target=first_use, args=(cc.channel_reference,)) for cc in configs
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(service._pools) == 1
+        assert {id(client.pool) for client in service.channels.values()} == {
+            id(pool) for pool in service._pools.values()
+        }
+        service.close()
+
+    @patch("SlackNotifications.slack.PooledWebhookClient")
     def test_init_stores_channels_dict(
         self,
         mock_webhook_client: MagicMock,
@@ -73,6 +126,10 @@ class TestInitialization:
         ]
 
         service = SlackNotificationService(service_config)
+        assert service.channels == {}
+
+        service.get_webhook("alerts")
+        service.get_webhook("errors")
 
         assert set(service.channels.keys()) == {"alerts", "errors"}
         assert isinstance(service.channels["alerts"], MagicMock)
@@ -114,9 +171,44 @@ class TestInitialization:
         with pytest.raises(SlackNotificationChannelDuplicateReferenceException):
             SlackNotificationService(config)
 
+    @patch("SlackNotifications.slack.PooledWebhookClient")
+    def test_duplicate_channel_references_reported_before_clients_built(
+        self, mock_webhook_client: MagicMock, channel_configs: List[SlackChannelConfig]
+    ) -> None:
+        duplicate = SlackChannelConfig(
+            channel_reference="alerts",
+            channel_webhook_url="https://hooks.slack.com/services/T000/FAKEFAKE/other-alerts",
+        )
+        config = SlackNotificationServiceConfig(
+            channels=[duplicate, *channel_configs, duplicate, channel_configs[1]]
+        )
+
+        with pytest.raises(SlackNotificationChannelDuplicateReferenceException) as exc:
+            SlackNotificationService(config)
+
+        assert "references=[alerts, errors]" in str(exc.value)
+        mock_webhook_client.assert_not_called()
+
+
+class TestConfig:
+    def test_configs_are_frozen_and_slotted(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        channel_config = service_config.channels[0]
+
+        with pytest.raises(FrozenInstanceError):
+            channel_config.channel_reference = "other"  # type: ignore[misc]
+        with pytest.raises(FrozenInstanceError):
+            service_config.verbose = True  # type: ignore[misc]
+        assert not hasattr(channel_config, "__dict__")
+        assert not hasattr(service_config, "__dict__")
+
+    def test_channel_configs_are_hashable(self, channel_configs: List[SlackChannelConfig]) -> None:
+        assert len({*channel_configs, *channel_configs}) == len(channel_configs)
+
 
 class TestGetWebhook:
-    @patch("SlackNotifications.slack.WebhookClient")
+    @patch("SlackNotifications.slack.PooledWebhookClient")
     def test_get_webhook_returns_existing_channel(
         self, mock_webhook_client: MagicMock, service_config: SlackNotificationServiceConfig
     ) -> None:
@@ -128,9 +220,22 @@ class TestGetWebhook:
         webhook = service.get_webhook("alerts")
         assert webhook is mock_webhook_instance
 
-    @patch("SlackNotifications.slack.WebhookClient")
-    def test_get_webhook_raises_for_unknown_channel(
+    def test_get_webhook_uses_http2_pool_when_enabled(
         self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        pytest.importorskip("httpx")
+        service = SlackNotificationService(replace(service_config, http2=True))
+
+        alerts = service.get_webhook("alerts")
+        errors = service.get_webhook("errors")
+
+        assert isinstance(alerts.pool, HTTP2ConnectionPool)
+        assert alerts.pool is errors.pool
+        service.close()
+
+    @patch("SlackNotifications.slack.PooledWebhookClient")
+    def test_get_webhook_raises_for_unknown_channel(
+        self, mock_webhook_client: MagicMock, service_config: SlackNotificationServiceConfig
     ) -> None:
         service = SlackNotificationService(service_config)
 
@@ -163,6 +268,7 @@ class TestSendMessageToSlack:
         self, service_config: SlackNotificationServiceConfig
     ) -> None:
         service = SlackNotificationService(service_config)
+        service.max_retries = 0
 
         mock_webhook = MagicMock()
         mock_response = MagicMock(status_code=500, body="internal error")
@@ -203,6 +309,261 @@ class TestSendMessageToSlack:
         assert "ok" in caplog.text
 
 
+class TestSendMessageRateLimit:
+    def test_channels_get_token_buckets(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        channels = [
+            service_config.channels[0],
+            replace(service_config.channels[1], rate_per_sec=None),
+        ]
+
+        service = SlackNotificationService(replace(service_config, channels=channels))
+
+        assert set(service._buckets) == {"alerts"}
+        assert service._buckets["alerts"].rate == 1.0
+
+    def test_send_message_to_slack_acquires_token(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(service_config)
+
+        mock_bucket = MagicMock()
+        service._buckets = {"alerts": mock_bucket}
+        mock_webhook = MagicMock()
+        mock_webhook.send.return_value = MagicMock(status_code=200, body="ok")
+        service.channels = {"alerts": mock_webhook}
+
+        service.send_message_to_slack("alerts", [])
+
+        mock_bucket.acquire.assert_called_once_with()
+
+
+class TestSendMessageConcurrency:
+    def test_concurrency_limit_starts_at_max_concurrency(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(replace(service_config, max_concurrency=8))
+
+        assert service._aimd.limit == 8
+        assert service._aimd.max_limit == 8
+
+    def test_fast_success_raises_concurrency_limit(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(service_config)
+        service._aimd.limit = 1
+        mock_webhook = MagicMock()
+        mock_webhook.send.return_value = MagicMock(status_code=200, body="ok")
+        service.channels = {"alerts": mock_webhook}
+        service._buckets = {}
+
+        for _ in range(4):
+            service.send_message_to_slack("alerts", [])
+
+        assert service._aimd.limit == 3
+        assert service._aimd.in_flight == 0
+
+    def test_server_error_lowers_concurrency_limit(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(service_config)
+        service.max_retries = 0
+        service._aimd.limit = 8
+        mock_webhook = MagicMock()
+        mock_webhook.send.return_value = MagicMock(status_code=503, body="unavailable")
+        service.channels = {"alerts": mock_webhook}
+
+        with pytest.raises(SlackNotificationSendFailedException):
+            service.send_message_to_slack("alerts", [])
+
+        assert service._aimd.limit == 4
+        assert service._aimd.in_flight == 0
+
+    def test_transport_error_lowers_limit_and_releases_slot(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(service_config)
+        service._aimd.limit = 8
+        mock_webhook = MagicMock()
+        mock_webhook.send.side_effect = TimeoutError("timed out")
+        service.channels = {"alerts": mock_webhook}
+
+        with pytest.raises(TimeoutError):
+            service.send_message_to_slack("alerts", [])
+
+        assert service._aimd.limit == 4
+        assert service._aimd.in_flight == 0
+
+    def test_unknown_channel_leaves_concurrency_limit(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(service_config)
+        service._aimd.limit = 8
+
+        with pytest.raises(SlackNotificationChannelNotFoundException):
+            service.send_message_to_slack("nonexistent", [])
+
+        assert service._aimd.limit == 8
+        assert service._aimd.in_flight == 0
+
+    def test_non_transport_error_leaves_limit_and_releases_slot(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(service_config)
+        service._aimd.limit = 8
+        mock_webhook = MagicMock()
+        mock_webhook.send.side_effect = TypeError("bad block")
+        service.channels = {"alerts": mock_webhook}
+
+        with pytest.raises(TypeError):
+            service.send_message_to_slack("alerts", [])
+
+        assert service._aimd.limit == 8
+        assert service._aimd.in_flight == 0
+
+
+class TestSendMessageCircuitBreaker:
+    def test_breaker_opens_after_consecutive_server_errors(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(
+            replace(service_config, max_retries=0, circuit_failure_threshold=2)
+        )
+        service._buckets = {}
+        mock_webhook = MagicMock()
+        mock_webhook.send.return_value = MagicMock(status_code=500, body="internal error")
+        service.channels = {"alerts": mock_webhook}
+
+        for _ in range(2):
+            with pytest.raises(SlackNotificationSendFailedException):
+                service.send_message_to_slack("alerts", [])
+
+        with pytest.raises(SlackNotificationChannelCircuitOpenException) as exc:
+            service.send_message_to_slack("alerts", [])
+
+        assert mock_webhook.send.call_count == 2
+        assert "alerts" in str(exc.value)
+        assert exc.value.retry_in > 0
+
+    def test_rate_limits_do_not_open_breaker(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(
+            replace(service_config, max_retries=0, circuit_failure_threshold=1)
+        )
+        service._buckets = {}
+        mock_webhook = MagicMock()
+        mock_webhook.send.return_value = MagicMock(status_code=429, body="rate_limited")
+        service.channels = {"alerts": mock_webhook}
+
+        for _ in range(3):
+            with pytest.raises(SlackNotificationSendFailedException):
+                service.send_message_to_slack("alerts", [])
+
+        assert mock_webhook.send.call_count == 3
+
+    def test_unserializable_payload_leaves_breaker_closed(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(
+            replace(service_config, max_retries=0, circuit_failure_threshold=2)
+        )
+        service._buckets = {}
+        blocks: List[Dict[str, Any]] = [{"type": "section", "fields": {"not", "json"}}]
+
+        for _ in range(3):
+            with pytest.raises(TypeError):
+                service.send_message_to_slack("alerts", blocks)
+
+        assert service._breakers["alerts"].state == CircuitBreaker.CLOSED
+        service.close()
+
+    def test_transport_errors_open_breaker(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(
+            replace(service_config, max_retries=0, circuit_failure_threshold=2)
+        )
+        service._buckets = {}
+        mock_webhook = MagicMock()
+        mock_webhook.send.side_effect = TimeoutError("timed out")
+        service.channels = {"alerts": mock_webhook}
+
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                service.send_message_to_slack("alerts", [])
+
+        assert service._breakers["alerts"].state == CircuitBreaker.OPEN
+
+    def test_breaker_disabled_when_threshold_zero(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(replace(service_config, circuit_failure_threshold=0))
+
+        assert service._breakers == {}
+
+
+class TestSendMessageRetry:
+    @pytest.fixture
+    def sleeps(self, monkeypatch: pytest.MonkeyPatch) -> List[float]:
+        recorded: List[float] = []
+        monkeypatch.setattr("SlackNotifications.slack.time.sleep", recorded.append)
+        return recorded
+
+    def test_rate_limited_send_honours_retry_after(
+        self, service_config: SlackNotificationServiceConfig, sleeps: List[float]
+    ) -> None:
+        service = SlackNotificationService(service_config)
+
+        mock_webhook = MagicMock()
+        mock_webhook.send.side_effect = [
+            MagicMock(status_code=429, body="rate_limited", headers={"Retry-After": "7"}),
+            MagicMock(status_code=200, body="ok"),
+        ]
+        service.channels = {"alerts": mock_webhook}
+
+        service.send_message_to_slack("alerts", [])
+
+        assert mock_webhook.send.call_count == 2
+        assert sleeps == [7.0]
+
+    def test_server_errors_back_off_exponentially(
+        self, service_config: SlackNotificationServiceConfig, sleeps: List[float]
+    ) -> None:
+        service = SlackNotificationService(service_config)
+        service.max_retries = 2
+        service.retry_backoff = 1.0
+
+        mock_webhook = MagicMock()
+        mock_webhook.send.return_value = MagicMock(status_code=503, body="unavailable", headers={})
+        service.channels = {"alerts": mock_webhook}
+
+        with pytest.raises(SlackNotificationSendFailedException) as exc:
+            service.send_message_to_slack("alerts", [])
+
+        assert mock_webhook.send.call_count == 3
+        assert "503" in str(exc.value)
+        assert len(sleeps) == 2
+        assert 1.0 <= sleeps[0] <= 2.0
+        assert 2.0 <= sleeps[1] <= 3.0
+
+    def test_client_errors_are_not_retried(
+        self, service_config: SlackNotificationServiceConfig, sleeps: List[float]
+    ) -> None:
+        service = SlackNotificationService(service_config)
+
+        mock_webhook = MagicMock()
+        mock_webhook.send.return_value = MagicMock(status_code=404, body="no_service")
+        service.channels = {"alerts": mock_webhook}
+
+        with pytest.raises(SlackNotificationSendFailedException):
+            service.send_message_to_slack("alerts", [])
+
+        mock_webhook.send.assert_called_once()
+        assert sleeps == []
+
+
 class TestSendMessageRouting:
     def test_send_message_uses_real_slack_when_flag_true(
         self, service_config: SlackNotificationServiceConfig, monkeypatch: pytest.MonkeyPatch
@@ -255,6 +616,449 @@ class TestSendMessageRouting:
 
         assert "[DUMMY SLACK MESSAGE] alerts : [{'dummy': 'block'}]" in caplog.text
 
+    def test_send_dummy_message_skips_formatting_when_info_disabled(
+        self, service_config: SlackNotificationServiceConfig, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        service = SlackNotificationService(service_config)
+        reprs: List[str] = []
+
+        class Block(dict):  # type: ignore[type-arg]
+            def __repr__(self) -> str:
+                reprs.append("called")
+                return "block"
+
+        with caplog.at_level(logging.WARNING, logger=slack_logger.name):
+            service.send_dummy_message("alerts", [Block()])
+
+        assert reprs == []
+        assert caplog.text == ""
+
+
+class TestSendMessageCoalescing:
+    @pytest.fixture
+    def coalescing_service(
+        self, service_config: SlackNotificationServiceConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> SlackNotificationService:
+        service = SlackNotificationService(replace(service_config, coalesce_window_ms=60_000))
+        monkeypatch.setattr(service, "send_message_to_slack", MagicMock())
+        return service
+
+    def test_messages_within_window_are_merged(
+        self, coalescing_service: SlackNotificationService
+    ) -> None:
+        first = [coalescing_service.section_block("first")]
+        second = [coalescing_service.section_block("second")]
+
+        coalescing_service.send_message("alerts", first)
+        coalescing_service.send_message("alerts", second)
+        coalescing_service.send_message("errors", first)
+        mock_send: MagicMock = coalescing_service.send_message_to_slack  # type: ignore[assignment]
+        mock_send.assert_not_called()
+
+        coalescing_service.flush()
+
+        assert mock_send.call_count == 2
+        mock_send.assert_any_call("alerts", [*first, {"type": "divider"}, *second])
+        mock_send.assert_any_call("errors", first)
+        assert coalescing_service._flush_timers == {}
+
+    def test_window_elapsing_flushes_in_background(
+        self, coalescing_service: SlackNotificationService
+    ) -> None:
+        coalescing_service.coalesce_window_ms = 10
+        sent = threading.Event()
+        mock_send: MagicMock = coalescing_service.send_message_to_slack  # type: ignore[assignment]
+        mock_send.side_effect = lambda reference, blocks: sent.set()
+
+        coalescing_service.send_message("alerts", [{"type": "divider"}])
+
+        assert sent.wait(timeout=1)
+        mock_send.assert_called_once_with("alerts", [{"type": "divider"}])
+
+    def test_merged_messages_respect_block_limit(
+        self, coalescing_service: SlackNotificationService
+    ) -> None:
+        blocks = [coalescing_service.section_block(str(i)) for i in range(30)]
+
+        coalescing_service.send_message("alerts", blocks)
+        coalescing_service.send_message("alerts", blocks)
+        coalescing_service.close()
+
+        mock_send: MagicMock = coalescing_service.send_message_to_slack  # type: ignore[assignment]
+        assert [call.args[1] for call in mock_send.call_args_list] == [blocks, blocks]
+
+    def test_queued_message_unaffected_by_caller_reusing_list(
+        self, coalescing_service: SlackNotificationService
+    ) -> None:
+        blocks = [coalescing_service.section_block("first")]
+
+        coalescing_service.send_message("alerts", blocks)
+        blocks.clear()
+        coalescing_service.flush()
+
+        mock_send: MagicMock = coalescing_service.send_message_to_slack  # type: ignore[assignment]
+        mock_send.assert_called_once_with("alerts", [coalescing_service.section_block("first")])
+
+    def test_unknown_channel_raises_immediately(
+        self, coalescing_service: SlackNotificationService
+    ) -> None:
+        with pytest.raises(SlackNotificationChannelNotFoundException):
+            coalescing_service.send_message("nonexistent", [])
+
+    def test_failed_send_does_not_drop_remaining_messages(
+        self, coalescing_service: SlackNotificationService
+    ) -> None:
+        blocks = [coalescing_service.section_block(str(i)) for i in range(30)]
+        mock_send: MagicMock = coalescing_service.send_message_to_slack  # type: ignore[assignment]
+        failure = SlackNotificationSendFailedException("alerts", 500, "internal_error")
+        mock_send.side_effect = [failure, None, None]
+
+        for _ in range(3):
+            coalescing_service.send_message("alerts", blocks)
+        with pytest.raises(SlackNotificationSendFailedException) as exc:
+            coalescing_service.flush()
+
+        assert exc.value is failure
+        assert [call.args[1] for call in mock_send.call_args_list] == [blocks] * 3
+        assert coalescing_service._pending == {}
+
+    def test_close_releases_resources_when_flush_fails(
+        self, coalescing_service: SlackNotificationService
+    ) -> None:
+        mock_send: MagicMock = coalescing_service.send_message_to_slack  # type: ignore[assignment]
+        mock_send.side_effect = TimeoutError("timed out")
+        executor = coalescing_service._get_executor()
+        mock_pool = MagicMock()
+        coalescing_service._pools = {("https", "hooks.slack.com", None): mock_pool}
+
+        coalescing_service.send_message("alerts", [{"type": "divider"}])
+        with pytest.raises(TimeoutError):
+            coalescing_service.close()
+
+        assert coalescing_service._executor is None
+        assert executor._shutdown
+        mock_pool.close.assert_called_once_with()
+
+
+class TestClose:
+    def test_sends_after_close_rebuild_clients(
+        self, webhook_server: Tuple[str, Type[_WebhookHandler]]
+    ) -> None:
+        pytest.importorskip("httpx")
+        base_url, handler = webhook_server
+        service = SlackNotificationService(
+            SlackNotificationServiceConfig(
+                channels=[SlackChannelConfig("alerts", f"{base_url}/services/T000/A000/alerts")],
+                http2=True,
+            )
+        )
+        service._buckets = {}
+
+        service.send_message_to_slack("alerts", [])
+        first_client = service.get_webhook("alerts")
+        service.close()
+        service.send_message_to_slack("alerts", [])
+        service.close()
+
+        assert service.get_webhook("alerts") is not first_client
+        assert service._breakers["alerts"].state == CircuitBreaker.CLOSED
+        assert len(handler.requests) == 2
+        service.close()
+
+
+class TestSendMessageMany:
+    @pytest.fixture
+    def broadcast_service(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> SlackNotificationService:
+        service = SlackNotificationService(replace(service_config, max_retries=0))
+        service._buckets = {}
+        for reference in ("alerts", "errors"):
+            mock_webhook = MagicMock(name=reference)
+            mock_webhook.send_raw.return_value = MagicMock(status_code=200, body="ok")
+            service.channels[reference] = mock_webhook
+        return service
+
+    def test_send_message_many_serializes_once(
+        self, broadcast_service: SlackNotificationService
+    ) -> None:
+        blocks: List[Dict[str, Any]] = [{"type": "divider"}]
+        channels = dict(broadcast_service.channels)
+
+        broadcast_service.send_message_many(["alerts", "errors"], blocks)
+        broadcast_service.close()
+
+        bodies = [
+            channels[reference].send_raw.call_args.args[0]  # type: ignore[attr-defined]
+            for reference in ("alerts", "errors")
+        ]
+        assert bodies[0] is bodies[1]
+        assert json.loads(bodies[0]) == {"blocks": blocks}
+
+    def test_send_message_many_runs_channels_concurrently(
+        self, broadcast_service: SlackNotificationService
+    ) -> None:
+        barrier = threading.Barrier(2, timeout=1)
+
+        def send_raw(raw_body: bytes) -> MagicMock:
+            # Each send waits for the other, which only completes if they run in parallel
+            barrier.wait()
+            return MagicMock(status_code=200, body="ok")
+
+        for webhook in broadcast_service.channels.values():
+            webhook.send_raw.side_effect = send_raw  # type: ignore[attr-defined]
+
+        broadcast_service.send_message_many(["alerts", "errors"], [])
+        broadcast_service.close()
+
+    def test_send_message_many_aggregates_failures(
+        self, broadcast_service: SlackNotificationService
+    ) -> None:
+        broadcast_service.channels["errors"].send_raw.return_value = MagicMock(  # type: ignore[attr-defined]
+            status_code=500, body="internal error"
+        )
+        channels = dict(broadcast_service.channels)
+
+        with pytest.raises(SlackNotificationBroadcastFailedException) as exc:
+            broadcast_service.send_message_many(["alerts", "errors", "nonexistent"], [])
+        broadcast_service.close()
+
+        # Failures on some channels don't stop delivery to the others
+        channels["alerts"].send_raw.assert_called_once()  # type: ignore[attr-defined]
+        assert set(exc.value.errors) == {"errors", "nonexistent"}
+        assert "channels=[errors, nonexistent]" in str(exc.value)
+        assert "500" in str(exc.value)
+
+    def test_send_message_many_routes_dummy_messages(
+        self, service_config: SlackNotificationServiceConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        service = SlackNotificationService(replace(service_config, send_to_slack=False))
+        mock_send = MagicMock()
+        monkeypatch.setattr(service, "send_message", mock_send)
+
+        blocks: List[Dict[str, Any]] = [{"type": "divider"}]
+        service.send_message_many(["alerts", "errors"], blocks)
+        service.close()
+
+        assert sorted(call.args for call in mock_send.call_args_list) == [
+            ("alerts", blocks),
+            ("errors", blocks),
+        ]
+
+
+class TestSendMessageAsync:
+    @patch("SlackNotifications.slack.AsyncWebhookClient")
+    def test_send_messages_async_shares_one_session(
+        self,
+        mock_async_client: MagicMock,
+        service_config: SlackNotificationServiceConfig,
+    ) -> None:
+        pytest.importorskip("aiohttp")
+        mock_async_client.return_value.send = AsyncMock(
+            return_value=MagicMock(status_code=200, body="ok")
+        )
+        service = SlackNotificationService(service_config)
+
+        blocks: List[Dict[str, Any]] = [
+            {"type": "section", "text": {"type": "mrkdwn", "text": "Hello"}}
+        ]
+
+        async def run() -> None:
+            await service.send_messages_async([("alerts", blocks), ("errors", blocks)])
+            await service.send_message_async("alerts", blocks)
+            await service.aclose()
+
+        asyncio.run(run())
+
+        # One client per channel, all bound to the same session
+        assert mock_async_client.call_count == 2
+        sessions = {call.kwargs["session"] for call in mock_async_client.call_args_list}
+        assert len(sessions) == 1
+        assert mock_async_client.return_value.send.await_count == 3
+
+    @patch("SlackNotifications.slack.AsyncWebhookClient")
+    def test_send_message_async_failure_raises_exception(
+        self,
+        mock_async_client: MagicMock,
+        service_config: SlackNotificationServiceConfig,
+    ) -> None:
+        pytest.importorskip("aiohttp")
+        mock_async_client.return_value.send = AsyncMock(
+            return_value=MagicMock(status_code=500, body="internal error")
+        )
+        service = SlackNotificationService(replace(service_config, max_retries=0))
+
+        async def run() -> None:
+            try:
+                await service.send_message_async("alerts", [])
+            finally:
+                await service.aclose()
+
+        with pytest.raises(SlackNotificationSendFailedException):
+            asyncio.run(run())
+
+    @patch("SlackNotifications.slack.AsyncWebhookClient")
+    def test_send_message_async_honours_retry_after(
+        self,
+        mock_async_client: MagicMock,
+        service_config: SlackNotificationServiceConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        pytest.importorskip("aiohttp")
+        mock_async_client.return_value.send = AsyncMock(
+            side_effect=[
+                MagicMock(status_code=429, body="rate_limited", headers={"Retry-After": "7"}),
+                MagicMock(status_code=200, body="ok"),
+            ]
+        )
+        mock_sleep = AsyncMock()
+        monkeypatch.setattr("SlackNotifications.slack.asyncio.sleep", mock_sleep)
+        service = SlackNotificationService(service_config)
+
+        async def run() -> None:
+            try:
+                await service.send_message_async("alerts", [])
+            finally:
+                await service.aclose()
+
+        asyncio.run(run())
+
+        assert mock_async_client.return_value.send.await_count == 2
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    @patch("SlackNotifications.slack.AsyncWebhookClient")
+    def test_send_message_async_fails_fast_when_circuit_open(
+        self,
+        mock_async_client: MagicMock,
+        service_config: SlackNotificationServiceConfig,
+    ) -> None:
+        pytest.importorskip("aiohttp")
+        mock_async_client.return_value.send = AsyncMock(
+            return_value=MagicMock(status_code=500, body="internal error")
+        )
+        service = SlackNotificationService(
+            replace(service_config, max_retries=0, circuit_failure_threshold=1)
+        )
+
+        async def run() -> None:
+            try:
+                with pytest.raises(SlackNotificationSendFailedException):
+                    await service.send_message_async("alerts", [])
+                with pytest.raises(SlackNotificationChannelCircuitOpenException):
+                    await service.send_message_async("alerts", [])
+            finally:
+                await service.aclose()
+
+        asyncio.run(run())
+
+        assert mock_async_client.return_value.send.await_count == 1
+
+    def test_send_messages_async_across_event_loops(
+        self, webhook_server: Tuple[str, Type[_WebhookHandler]]
+    ) -> None:
+        pytest.importorskip("aiohttp")
+        base_url, handler = webhook_server
+        service = SlackNotificationService(
+            SlackNotificationServiceConfig(
+                channels=[
+                    SlackChannelConfig(
+                        "alerts", f"{base_url}/services/T000/A000/alerts", rate_per_sec=None
+                    ),
+                    SlackChannelConfig(
+                        "errors", f"{base_url}/services/T000/A000/errors", rate_per_sec=None
+                    ),
+                ]
+            )
+        )
+        messages: List[Tuple[str, List[Dict[str, Any]]]] = [("alerts", []), ("errors", [])]
+
+        # Each asyncio.run uses a fresh loop; the session from the first must not be reused
+        asyncio.run(service.send_messages_async(messages))
+        first_session = service._async_session
+        asyncio.run(service.send_messages_async(messages))
+        second_session = service._async_session
+        asyncio.run(service.aclose())
+
+        assert second_session is not first_session
+        # Closed as its loop shut down, rather than leaking its connections
+        assert first_session is not None and first_session.closed
+        assert len(handler.requests) == 4
+
+    def test_send_message_async_raises_for_unknown_channel(
+        self, service_config: SlackNotificationServiceConfig
+    ) -> None:
+        service = SlackNotificationService(service_config)
+
+        with pytest.raises(SlackNotificationChannelNotFoundException):
+            asyncio.run(service.send_message_async("nonexistent", []))
+
+    def test_send_message_async_uses_dummy_when_flag_false(
+        self, service_config: SlackNotificationServiceConfig, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        service = SlackNotificationService(service_config)
+        service.send_to_slack = False
+
+        with caplog.at_level(logging.INFO):
+            asyncio.run(service.send_message_async("alerts", [{"dummy": "block"}]))
+
+        assert "[DUMMY SLACK MESSAGE] alerts" in caplog.text
+
+
+class TestModuleLevelHelpers:
+    def test_helpers_usable_without_service(self) -> None:
+        blocks = [
+            slack.section_block(slack.bold_text("Deploy")),
+            slack.divider_block(),
+            slack.section_block(slack.list_items([slack.url_link("v1.2.3", "https://x.io")])),
+            slack.footer_block(slack.italic_text("bot")),
+        ]
+
+        assert blocks == [
+            {"type": "section", "text": {"type": "mrkdwn", "text": "*Deploy*"}},
+            {"type": "divider"},
+            {"type": "section", "text": {"type": "mrkdwn", "text": "• <https://x.io|v1.2.3>"}},
+            {"type": "context", "elements": [{"type": "mrkdwn", "text": "_bot_"}]},
+        ]
+        assert slack.generic_message_blocks("T", "M") == [slack.section_block("*T*\nM")]
+        assert slack.list_items_numbered(["a"]) == "1. a"
+
+    def test_methods_proxy_module_helpers(
+        self, service_for_helpers: SlackNotificationService
+    ) -> None:
+        assert service_for_helpers.section_block is slack.section_block
+        assert SlackNotificationService.divider_block is slack.divider_block
+
+
+class TestMessageBuilder:
+    def test_builder_matches_helper_composition(self) -> None:
+        items = ["api", "worker"]
+
+        block = (
+            MessageBuilder()
+            .bold("Deploy")
+            .text(" of ")
+            .link("v1.2.3", "https://example.com")
+            .line()
+            .italic("services")
+            .line()
+            .bullets(items)
+            .numbered(items)
+            .build_section()
+        )
+
+        expected = (
+            f"{slack.bold_text('Deploy')} of {slack.url_link('v1.2.3', 'https://example.com')}\n"
+            f"{slack.italic_text('services')}\n"
+            f"{slack.list_items(items)}\n"
+            f"{slack.list_items_numbered(items)}"
+        )
+        assert block == slack.section_block(expected)
+
+    def test_empty_builder(self) -> None:
+        builder = MessageBuilder()
+        assert builder.getvalue() == ""
+        assert builder.build_section() == slack.section_block("")
+
 
 class TestHelperBlocksAndFormatting:
     def test_generic_message_blocks(self, service_for_helpers: SlackNotificationService) -> None:
@@ -267,10 +1071,25 @@ class TestHelperBlocksAndFormatting:
         assert "*Title*" in block["text"]["text"]
         assert "Message" in block["text"]["text"]
 
+    def test_generic_message_blocks_exact_text(
+        self, service_for_helpers: SlackNotificationService
+    ) -> None:
+        blocks = service_for_helpers.generic_message_blocks("50% done", "%s {x}")
+        assert blocks == [
+            {"type": "section", "text": {"type": "mrkdwn", "text": "*50% done*\n%s {x}"}}
+        ]
+
     def test_divider_block(self, service_for_helpers: SlackNotificationService) -> None:
         block = service_for_helpers.divider_block()
         assert block == {"type": "divider"}
 
+    def test_divider_block_returns_independent_copies(
+        self, service_for_helpers: SlackNotificationService
+    ) -> None:
+        block = service_for_helpers.divider_block()
+        block["block_id"] = "mutated"
+        assert service_for_helpers.divider_block() == {"type": "divider"}
+
     def test_section_block(self, service_for_helpers: SlackNotificationService) -> None:
         text = "Some text"
         block = service_for_helpers.section_block(text)
@@ -294,6 +1113,17 @@ class TestHelperBlocksAndFormatting:
         lines = result.split("\n")
         assert lines == ["1. first", "2. second", "3. third"]
 
+    def test_list_items_numbered_beyond_prefix_cache(
+        self, service_for_helpers: SlackNotificationService
+    ) -> None:
+        items = [f"item {i}" for i in range(1, 1031)]
+        lines = service_for_helpers.list_items_numbered(items).split("\n")
+        assert lines == [f"{i}. item {i}" for i in range(1, 1031)]
+
+    def test_list_items_empty(self, service_for_helpers: SlackNotificationService) -> None:
+        assert service_for_helpers.list_items([]) == ""
+        assert service_for_helpers.list_items_numbered([]) == ""
+
     def test_bold_text(self, service_for_helpers: SlackNotificationService) -> None:
         assert service_for_helpers.bold_text("bold") == "*bold*"
 
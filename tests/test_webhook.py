@@ -0,0 +1,345 @@
+import json
+import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+from unittest.mock import MagicMock
+
+import pytest
+from slack_sdk.http_retry.builtin_handlers import (
+    ConnectionErrorRetryHandler,
+    ServerErrorRetryHandler,
+)
+from slack_sdk.http_retry.builtin_interval_calculators import FixedValueRetryIntervalCalculator
+from slack_sdk.models.blocks import DividerBlock
+
+from SlackNotifications.webhook import (
+    ConnectionPool,
+    HTTP2ConnectionPool,
+    HTTPConnectionPool,
+    PooledWebhookClient,
+    dumps,
+    encode_blocks,
+    pool_for_url,
+)
+from tests.conftest import _WebhookHandler
+
+
+@pytest.fixture
+def pools() -> Iterator[Dict[Tuple[str, str, Optional[int]], ConnectionPool]]:
+    pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool] = {}
+    yield pools
+    for pool in pools.values():
+        pool.close()
+
+
+class TestPooledWebhookClient:
+    def test_reuses_connection_across_channels(
+        self,
+        webhook_server: Tuple[str, Type[_WebhookHandler]],
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool],
+    ) -> None:
+        base_url, handler = webhook_server
+        alerts_url = f"{base_url}/services/T000/A000/alerts"
+        errors_url = f"{base_url}/services/T000/A000/errors"
+        alerts = PooledWebhookClient(alerts_url, pool=pool_for_url(pools, alerts_url, 2))
+        errors = PooledWebhookClient(errors_url, pool=pool_for_url(pools, errors_url, 2))
+
+        blocks = [{"type": "divider"}]
+        responses = [alerts.send(blocks=blocks), errors.send(blocks=blocks), alerts.send(text="x")]
+
+        assert [r.status_code for r in responses] == [200, 200, 200]
+        assert [r.body for r in responses] == ["ok", "ok", "ok"]
+        assert len(pools) == 1
+        paths = [path for path, _, _ in handler.requests]
+        assert paths == [
+            "/services/T000/A000/alerts",
+            "/services/T000/A000/errors",
+            "/services/T000/A000/alerts",
+        ]
+        # All three requests travelled over the same TCP connection
+        assert len({port for _, port, _ in handler.requests}) == 1
+        assert json.loads(handler.requests[0][2]) == {"blocks": blocks}
+
+    def test_send_raw_posts_body_verbatim(
+        self,
+        webhook_server: Tuple[str, Type[_WebhookHandler]],
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool],
+    ) -> None:
+        base_url, handler = webhook_server
+        url = f"{base_url}/services/T000/A000/alerts"
+        client = PooledWebhookClient(url, pool=pool_for_url(pools, url, 1))
+
+        response = client.send_raw(b'{"text":"hi"}')
+
+        assert response.status_code == 200
+        assert handler.requests[0][2] == b'{"text":"hi"}'
+        assert handler.headers_seen[0]["content-type"] == "application/json;charset=utf-8"
+        assert handler.headers_seen[0]["user-agent"] == client.default_headers["User-Agent"]
+
+    def test_send_serializes_compact_json_without_none_fields(
+        self,
+        webhook_server: Tuple[str, Type[_WebhookHandler]],
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool],
+    ) -> None:
+        base_url, handler = webhook_server
+        url = f"{base_url}/services/T000/A000/alerts"
+        client = PooledWebhookClient(url, pool=pool_for_url(pools, url, 1))
+
+        client.send(blocks=[{"type": "divider"}])
+
+        assert handler.requests[0][2] == b'{"blocks":[{"type":"divider"}]}'
+
+    def test_per_call_headers_use_default_request_building(
+        self,
+        webhook_server: Tuple[str, Type[_WebhookHandler]],
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool],
+    ) -> None:
+        base_url, handler = webhook_server
+        url = f"{base_url}/services/T000/A000/alerts"
+        client = PooledWebhookClient(url, pool=pool_for_url(pools, url, 1))
+
+        response = client.send(text="hi", headers={"X-Trace": "abc"})
+
+        assert response.status_code == 200
+        assert handler.headers_seen[0]["x-trace"] == "abc"
+        assert json.loads(handler.requests[0][2]) == {"text": "hi"}
+
+    def test_send_raw_goes_through_proxy(
+        self,
+        webhook_server: Tuple[str, Type[_WebhookHandler]],
+    ) -> None:
+        proxy_url, handler = webhook_server
+        url = "http://hooks.example.com/services/T000/A000/alerts"
+        pool = MagicMock()
+        client = PooledWebhookClient(url, pool=pool, proxy=proxy_url)
+
+        response = client.send_raw(b'{"text":"hi"}')
+
+        # The local server acts as the proxy, so it sees the absolute target URL
+        assert response.status_code == 200
+        assert handler.requests[0][0] == url
+        assert json.loads(handler.requests[0][2]) == {"text": "hi"}
+        pool.request.assert_not_called()
+
+    def test_error_status_returns_response(
+        self,
+        webhook_server: Tuple[str, Type[_WebhookHandler]],
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool],
+    ) -> None:
+        base_url, handler = webhook_server
+        handler.status = 500
+        url = f"{base_url}/services/T000/A000/alerts"
+        client = PooledWebhookClient(url, pool=pool_for_url(pools, url, 1))
+
+        response = client.send(text="hello")
+
+        assert response.status_code == 500
+        assert response.body == "internal_error"
+
+    def test_reconnects_when_idle_connection_was_closed(
+        self,
+        webhook_server: Tuple[str, Type[_WebhookHandler]],
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool],
+    ) -> None:
+        base_url, handler = webhook_server
+        handler.drop_idle = True
+        url = f"{base_url}/services/T000/A000/alerts"
+        client = PooledWebhookClient(url, pool=pool_for_url(pools, url, 1))
+
+        client.send(text="first")
+        response = client.send(text="second")
+
+        assert response.status_code == 200
+        assert len(handler.requests) == 2
+        assert handler.requests[0][1] != handler.requests[1][1]
+
+    def test_connection_errors_go_through_retry_handlers(
+        self,
+        webhook_server: Tuple[str, Type[_WebhookHandler]],
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool],
+    ) -> None:
+        base_url, handler = webhook_server
+        url = f"{base_url}/services/T000/A000/alerts"
+        pool = pool_for_url(pools, url, 1)
+        retry_handler = ConnectionErrorRetryHandler(
+            interval_calculator=FixedValueRetryIntervalCalculator(0)
+        )
+        client = PooledWebhookClient(url, pool=pool, retry_handlers=[retry_handler])
+        real_request = pool.request
+        attempts: List[int] = []
+
+        def flaky_request(*args: Any, **kwargs: Any) -> Any:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionResetError("reset")
+            return real_request(*args, **kwargs)
+
+        pool.request = flaky_request  # type: ignore[method-assign]
+
+        response = client.send(text="hello")
+
+        assert response.status_code == 200
+        assert len(attempts) == 2
+        assert len(handler.requests) == 1
+
+    def test_default_retry_handlers_apply_to_pooled_sends(
+        self, pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool]
+    ) -> None:
+        url = "https://hooks.slack.com/services/T000/A000/alerts"
+        client = PooledWebhookClient(url, pool=pool_for_url(pools, url, 1))
+
+        assert [type(h) for h in client.retry_handlers] == [ConnectionErrorRetryHandler]
+
+    def test_error_status_goes_through_retry_handlers(
+        self,
+        webhook_server: Tuple[str, Type[_WebhookHandler]],
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool],
+    ) -> None:
+        base_url, handler = webhook_server
+        handler.status = 500
+        url = f"{base_url}/services/T000/A000/alerts"
+        retry_handler = ServerErrorRetryHandler(
+            max_retry_count=2, interval_calculator=FixedValueRetryIntervalCalculator(0)
+        )
+        client = PooledWebhookClient(
+            url, pool=pool_for_url(pools, url, 1), retry_handlers=[retry_handler]
+        )
+
+        response = client.send_raw(b'{"text":"hi"}')
+
+        assert response.status_code == 500
+        assert len(handler.requests) == 3
+
+    def test_timeout_and_ssl_come_from_pool(
+        self, pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool]
+    ) -> None:
+        url = "https://hooks.slack.com/services/T000/A000/alerts"
+        ctx = ssl.create_default_context()
+        pool = pool_for_url(pools, url, 1, timeout=5, ssl=ctx)
+
+        client = PooledWebhookClient(url, pool=pool)
+
+        assert (pool.timeout, pool.ssl) == (5, ctx)
+        assert (client.timeout, client.ssl) == (5, ctx)
+        assert PooledWebhookClient(url, pool=pool, timeout=5, ssl=ctx).ssl is ctx
+
+    def test_rejects_timeout_and_ssl_the_pool_would_ignore(
+        self, pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool]
+    ) -> None:
+        url = "https://hooks.slack.com/services/T000/A000/alerts"
+        pool = pool_for_url(pools, url, 1)
+
+        with pytest.raises(ValueError, match="timeout=5"):
+            PooledWebhookClient(url, pool=pool, timeout=5)
+        with pytest.raises(ValueError, match="ssl="):
+            PooledWebhookClient(url, pool=pool, ssl=ssl.create_default_context())
+
+
+class TestDumps:
+    def test_dumps_is_compact_utf8(self) -> None:
+        body = {"blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": "café ✓"}}]}
+
+        raw = dumps(body)
+
+        assert isinstance(raw, bytes)
+        assert b" " not in raw.replace("café ✓".encode(), b"")
+        assert json.loads(raw) == body
+
+    def test_dumps_falls_back_for_payloads_orjson_rejects(self) -> None:
+        body = {"text": "big", "metadata": {"id": 2**70, 1: "non-str key"}}
+
+        assert json.loads(dumps(body)) == {
+            "text": "big",
+            "metadata": {"id": 2**70, "1": "non-str key"},
+        }
+
+    def test_dumps_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("SlackNotifications.webhook.orjson", None)
+
+        assert dumps({"text": "hi"}) == b'{"text":"hi"}'
+
+    def test_encode_blocks_accepts_block_models(self) -> None:
+        raw = encode_blocks([DividerBlock(), {"type": "divider"}])
+
+        assert json.loads(raw) == {"blocks": [{"type": "divider"}, {"type": "divider"}]}
+
+
+class TestHTTPConnectionPool:
+    def test_close_drops_idle_connections(
+        self, webhook_server: Tuple[str, Type[_WebhookHandler]]
+    ) -> None:
+        base_url, _ = webhook_server
+        pool = HTTPConnectionPool("http", "127.0.0.1", int(base_url.rsplit(":", 1)[1]))
+        pool.request("POST", "/hook", body=b"{}", headers={"Content-Length": "2"})
+        assert pool._idle.qsize() == 1
+
+        pool.close()
+
+        assert pool._idle.qsize() == 0
+
+    def test_pool_for_url_keys_by_origin(self) -> None:
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool] = {}
+        a = pool_for_url(pools, "https://hooks.slack.com/services/a", 4)
+        b = pool_for_url(pools, "https://hooks.slack.com/services/b", 4)
+        c = pool_for_url(pools, "https://example.com/services/c", 4)
+
+        assert a is b
+        assert a is not c
+        assert isinstance(a, HTTPConnectionPool)
+        assert (a.scheme, a.host, a.port) == ("https", "hooks.slack.com", None)
+
+
+class TestHTTP2ConnectionPool:
+    def test_channels_share_one_client(
+        self, webhook_server: Tuple[str, Type[_WebhookHandler]]
+    ) -> None:
+        pytest.importorskip("httpx")
+        base_url, handler = webhook_server
+        pools: Dict[Tuple[str, str, Optional[int]], ConnectionPool] = {}
+        alerts_url = f"{base_url}/services/T000/A000/alerts"
+        errors_url = f"{base_url}/services/T000/A000/errors"
+        alerts = PooledWebhookClient(alerts_url, pool=pool_for_url(pools, alerts_url, 2, True))
+        errors = PooledWebhookClient(errors_url, pool=pool_for_url(pools, errors_url, 2, True))
+
+        responses = [alerts.send(text="a"), errors.send(text="b"), alerts.send(text="c")]
+
+        assert alerts.pool is errors.pool
+        assert isinstance(alerts.pool, HTTP2ConnectionPool)
+        assert [(r.status_code, r.body) for r in responses] == [(200, "ok")] * 3
+        assert len({port for _, port, _ in handler.requests}) == 1
+        assert handler.headers_seen[0]["content-type"] == "application/json;charset=utf-8"
+        alerts.pool.close()
+
+    def test_http1_fallback_serves_concurrent_requests(
+        self, webhook_server: Tuple[str, Type[_WebhookHandler]]
+    ) -> None:
+        pytest.importorskip("httpx")
+        base_url, handler = webhook_server
+        handler.barrier = threading.Barrier(3, timeout=5)
+        url = f"{base_url}/services/T000/A000/alerts"
+        client = PooledWebhookClient(url, pool=pool_for_url({}, url, 3, http2=True))
+
+        # The local server only speaks HTTP/1.1, so concurrent sends need separate connections
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            responses = list(executor.map(lambda _: client.send(text="hi"), range(3)))
+
+        assert [r.status_code for r in responses] == [200] * 3
+        assert len({port for _, port, _ in handler.requests}) == 3
+        client.pool.close()
+
+    def test_error_status_exposes_headers(
+        self, webhook_server: Tuple[str, Type[_WebhookHandler]]
+    ) -> None:
+        pytest.importorskip("httpx")
+        base_url, handler = webhook_server
+        handler.status = 500
+        url = f"{base_url}/services/T000/A000/alerts"
+        client = PooledWebhookClient(url, pool=pool_for_url({}, url, 1, http2=True))
+
+        response = client.send(text="hello")
+
+        assert response.status_code == 500
+        assert response.body == "internal_error"
+        assert response.headers.get("content-type") == "text/plain; charset=utf-8"
+        client.pool.close()